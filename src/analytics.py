@@ -9,10 +9,204 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial, wraps
+import os
+import tempfile
 import warnings
 warnings.filterwarnings('ignore')
 
 
+# Dimension tables are indexed by their id so lookups join on the index
+_TABLE_INDEX = {
+    'products': 'product_id',
+    'warehouses': 'warehouse_id',
+    'suppliers': 'supplier_id',
+    'product_categories': 'category_id',
+}
+
+# Low-cardinality / repeatedly compared string columns stored as categoricals
+_CATEGORICAL_COLUMNS = {
+    'products': ('sku',),
+    'sales_orders': ('status',),
+    'purchase_orders': ('status',),
+    'stockout_events': ('root_cause',),
+    'customers': ('customer_type',),
+    'inventory_transactions': ('transaction_type', 'reference_type'),
+    'demand_forecasts': ('forecast_period', 'model_used'),
+}
+
+# Columns the analytics engine actually uses; other columns are dropped on load
+# so they are never carried through merges. Tables not listed keep all columns.
+_TABLE_COLUMNS = {
+    'products': ['product_id', 'sku', 'product_name', 'category_id', 'unit_cost',
+                 'lead_time_days'],
+    'inventory': ['warehouse_id', 'product_id', 'quantity_on_hand', 'reorder_point'],
+    'sales_orders': ['so_id', 'warehouse_id', 'order_date', 'status'],
+    'sales_order_items': ['so_id', 'product_id', 'quantity_ordered', 'unit_price'],
+    'purchase_orders': ['po_id', 'supplier_id', 'order_date', 'expected_delivery_date',
+                        'actual_delivery_date', 'status'],
+    'purchase_order_items': ['po_id', 'quantity_ordered', 'quantity_received'],
+    'suppliers': ['supplier_id', 'supplier_code', 'supplier_name', 'quality_rating'],
+    'warehouses': ['warehouse_id', 'warehouse_code', 'warehouse_name'],
+    'product_categories': ['category_id', 'category_name'],
+}
+
+
+def read_cached_table(data_dir: str, name: str,
+                      parse_dates: Tuple[str, ...] = (),
+                      columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load a dataset, caching a Parquet copy alongside the source CSV.
+    
+    The CSV is parsed once and written to `{name}.parquet`; later loads read the
+    typed, columnar copy (dates already stored as timestamps) unless the CSV has
+    been modified since (or there is no CSV at all). The Parquet copy keeps
+    every column; it is replaced atomically, and a copy that cannot be read is
+    rebuilt from the CSV.
+    
+    Args:
+        data_dir: Directory containing the generated CSV files
+        name: Table name (file name without extension)
+        parse_dates: Columns to parse as datetimes when reading the CSV
+        columns: Columns to return (all columns if None)
+        
+    Returns:
+        DataFrame with the table contents
+    """
+    csv_path = f"{data_dir}/{name}.csv"
+    parquet_path = f"{data_dir}/{name}.parquet"
+    
+    categorical = {col: 'category' for col in _CATEGORICAL_COLUMNS.get(name, ())}
+    
+    if (os.path.exists(parquet_path) and
+            (not os.path.exists(csv_path) or
+             os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path))):
+        try:
+            df = pd.read_parquet(parquet_path, columns=columns).astype(categorical)
+            # The generator stores integers in their narrowest type; widen them to the
+            # int64 a CSV read gives, so result dtypes do not depend on who wrote the file
+            df = df.astype({col: np.int64 for col in df.columns
+                            if pd.api.types.is_integer_dtype(df[col]) and df[col].dtype != np.int64})
+            return _as_datetime_columns(df, parse_dates)
+        except (OSError, ValueError):
+            # Unreadable cache (e.g. truncated): rebuild it from the CSV below
+            if not os.path.exists(csv_path):
+                raise
+    
+    df = pd.read_csv(csv_path, engine='pyarrow', parse_dates=list(parse_dates))
+    df = df.astype(categorical)
+    # Written to a temporary file and renamed into place, so readers never see a
+    # partially written cache
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=data_dir, prefix=f".{name}.", suffix=".parquet.tmp")
+        os.close(fd)
+        df.to_parquet(tmp_path, compression='zstd', index=False)
+        os.replace(tmp_path, parquet_path)
+    except OSError:
+        # Read-only data directory: keep serving from CSV
+        pass
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    if columns:
+        df = df[columns]
+    return _as_datetime_columns(df, parse_dates)
+
+
+def _as_datetime_columns(df: pd.DataFrame, parse_dates: Tuple[str, ...]) -> pd.DataFrame:
+    """
+    Give the requested date columns one datetime64[us] dtype whatever the source.
+    
+    The cache is built by whichever caller loads a table first, so dates it did not
+    ask for are stored as plain dates, and the generator's own Parquet copy uses
+    millisecond timestamps; both are normalized here.
+    """
+    convert = [col for col in parse_dates
+               if col in df.columns and df[col].dtype != 'datetime64[us]']
+    if convert:
+        df = df.assign(**{col: pd.to_datetime(df[col]).astype('datetime64[us]') for col in convert})
+    return df
+
+# Ordered labels of the classification columns; results carry them as categoricals
+# (best to worst) so counts come straight from the codes in a fixed order
+_TURNOVER_CATEGORIES = ['Fast Moving', 'Normal', 'Slow Moving', 'Dead Stock']
+_ROP_RECOMMENDATIONS = ['Increase ROP', 'Decrease ROP', 'Optimal']
+_SUPPLIER_TIERS = ['Platinum', 'Gold', 'Silver', 'Bronze']
+
+
+@lru_cache(maxsize=None)
+def _read_table(data_dir: str, name: str,
+                parse_dates: Tuple[str, ...] = ()) -> pd.DataFrame:
+    """
+    Load a dataset for the analytics engine via `read_cached_table`.
+    
+    Only the columns in `_TABLE_COLUMNS` are returned, integer id columns are
+    downcast to int32, and dimension tables come back indexed by their id
+    (`_TABLE_INDEX`).
+    Results are memoized per process, so every analytics class shares the same
+    frames and must treat them as read-only.
+    
+    Args:
+        data_dir: Directory containing the generated CSV files
+        name: Table name (file name without extension)
+        parse_dates: Columns to parse as datetimes when reading the CSV
+        
+    Returns:
+        DataFrame with the table contents
+    """
+    df = read_cached_table(data_dir, name, parse_dates, _TABLE_COLUMNS.get(name))
+    
+    # Surrogate ids fit in int32, halving the key bytes hashed by joins and groupbys
+    df = df.astype({col: np.int32 for col in df.columns
+                    if col.endswith('_id') and pd.api.types.is_integer_dtype(df[col])})
+    
+    if name in _TABLE_INDEX:
+        df = df.set_index(_TABLE_INDEX[name])
+    return df
+
+
+def _days_between(start: pd.Series, end: pd.Series) -> np.ndarray:
+    """
+    Whole days from `start` to `end`, computed on the raw datetime64 buffers.
+    
+    Equivalent to `(end - start).dt.days` without the per-element Timedelta
+    accessor: returns int32 days, or float64 with NaN when either date is missing.
+    """
+    delta = end.to_numpy() - start.to_numpy()
+    with np.errstate(invalid='ignore'):
+        days = delta // np.timedelta64(1, 'D')
+    missing = np.isnat(delta)
+    if missing.any():
+        return np.where(missing, np.nan, days)
+    return days.astype(np.int32)
+
+
+@lru_cache(maxsize=None)
+def _read_active_sales(data_dir: str) -> pd.DataFrame:
+    """
+    Join non-cancelled sales orders to their line items.
+    
+    The demand-based metrics all start from this join, so it is built once per
+    data directory and shared (read-only) instead of being re-merged per call.
+    
+    Args:
+        data_dir: Directory containing the generated CSV files
+        
+    Returns:
+        DataFrame with one row per order line of every non-cancelled order
+    """
+    sales_orders = _read_table(data_dir, 'sales_orders', parse_dates=('order_date',))
+    sales_order_items = _read_table(data_dir, 'sales_order_items')
+    
+    active_sales = sales_orders[sales_orders['status'] != 'Cancelled']
+    return active_sales[['so_id', 'warehouse_id', 'order_date']].merge(
+        sales_order_items[['so_id', 'product_id', 'quantity_ordered', 'unit_price']],
+        on='so_id'
+    )
+
+
 @dataclass
 class InventoryMetrics:
     """Container for inventory performance metrics"""
@@ -52,17 +246,19 @@ class InventoryAnalytics:
     
     def _load_data(self):
         """Load all required datasets"""
-        self.products = pd.read_csv(f"{self.data_dir}/products.csv")
-        self.inventory = pd.read_csv(f"{self.data_dir}/inventory.csv")
-        self.sales_orders = pd.read_csv(f"{self.data_dir}/sales_orders.csv", parse_dates=['order_date'])
-        self.sales_order_items = pd.read_csv(f"{self.data_dir}/sales_order_items.csv")
-        self.purchase_orders = pd.read_csv(f"{self.data_dir}/purchase_orders.csv", 
-                                           parse_dates=['order_date', 'expected_delivery_date', 'actual_delivery_date'])
-        self.purchase_order_items = pd.read_csv(f"{self.data_dir}/purchase_order_items.csv")
-        self.suppliers = pd.read_csv(f"{self.data_dir}/suppliers.csv")
-        self.warehouses = pd.read_csv(f"{self.data_dir}/warehouses.csv")
-        self.stockout_events = pd.read_csv(f"{self.data_dir}/stockout_events.csv", 
-                                           parse_dates=['stockout_start_date', 'stockout_end_date'])
+        self.products = _read_table(self.data_dir, 'products')
+        self.inventory = _read_table(self.data_dir, 'inventory')
+        self.sales_orders = _read_table(self.data_dir, 'sales_orders',
+                                        parse_dates=('order_date',))
+        self.sales_order_items = _read_table(self.data_dir, 'sales_order_items')
+        self.purchase_orders = _read_table(self.data_dir, 'purchase_orders',
+                                           parse_dates=('order_date', 'expected_delivery_date', 'actual_delivery_date'))
+        self.purchase_order_items = _read_table(self.data_dir, 'purchase_order_items')
+        self.suppliers = _read_table(self.data_dir, 'suppliers')
+        self.warehouses = _read_table(self.data_dir, 'warehouses')
+        self.stockout_events = _read_table(self.data_dir, 'stockout_events',
+                                           parse_dates=('stockout_start_date', 'stockout_end_date'))
+        self.sales_with_items = _read_active_sales(self.data_dir)
     
     def calculate_abc_classification(self, 
                                      lookback_days: int = 365,
@@ -81,16 +277,12 @@ class InventoryAnalytics:
         """
         cutoff_date = self.sales_orders['order_date'].max() - timedelta(days=lookback_days)
         
-        # Join sales data
-        recent_sales = self.sales_orders[
-            (self.sales_orders['order_date'] >= cutoff_date) & 
-            (self.sales_orders['status'] != 'Cancelled')
+        sales_with_items = self.sales_with_items[
+            self.sales_with_items['order_date'].to_numpy() >= cutoff_date.to_datetime64()
         ]
         
-        sales_with_items = recent_sales.merge(self.sales_order_items, on='so_id')
-        
         # Calculate revenue per product
-        product_revenue = sales_with_items.groupby('product_id').agg({
+        product_revenue = sales_with_items.groupby('product_id', observed=True, sort=False).agg({
             'quantity_ordered': 'sum',
             'unit_price': 'mean'
         }).reset_index()
@@ -104,19 +296,16 @@ class InventoryAnalytics:
         product_revenue['cumulative_pct'] = product_revenue['cumulative_revenue'] / total_revenue * 100
         
         # Assign ABC class
-        def assign_class(pct):
-            if pct <= a_threshold:
-                return 'A'
-            elif pct <= b_threshold:
-                return 'B'
-            return 'C'
-        
-        product_revenue['abc_class'] = product_revenue['cumulative_pct'].apply(assign_class)
+        product_revenue['abc_class'] = pd.cut(
+            product_revenue['cumulative_pct'],
+            bins=[-np.inf, a_threshold, b_threshold, np.inf],
+            labels=['A', 'B', 'C']
+        )
         
         # Add product details
-        result = product_revenue.merge(
-            self.products[['product_id', 'sku', 'product_name', 'unit_cost']],
-            on='product_id'
+        result = product_revenue.join(
+            self.products[['sku', 'product_name', 'unit_cost']],
+            on='product_id', how='inner'
         )
         
         return result[['product_id', 'sku', 'product_name', 'quantity_ordered', 
@@ -134,56 +323,46 @@ class InventoryAnalytics:
             DataFrame with turnover metrics per product/warehouse
         """
         # Filter inventory if warehouse specified
-        inv = self.inventory.copy()
+        inv = self.inventory
         if warehouse_id:
             inv = inv[inv['warehouse_id'] == warehouse_id]
         
         # Calculate COGS from sales
-        sales_with_items = self.sales_orders.merge(self.sales_order_items, on='so_id')
-        sales_with_items = sales_with_items[sales_with_items['status'] != 'Cancelled']
-        
-        cogs = sales_with_items.groupby(['warehouse_id', 'product_id']).agg({
-            'quantity_ordered': 'sum'
-        }).reset_index()
+        cogs = self.sales_with_items.groupby(
+            ['warehouse_id', 'product_id'], observed=True, sort=False
+        )['quantity_ordered'].sum().reset_index()
         
-        # Merge with products for unit cost
-        cogs = cogs.merge(self.products[['product_id', 'unit_cost']], on='product_id')
+        # Join products for unit cost
+        cogs = cogs.join(self.products[['unit_cost']], on='product_id', how='inner')
         cogs['cogs_annual'] = cogs['quantity_ordered'] * cogs['unit_cost']
         
         # Merge with inventory
         turnover = inv.merge(cogs, on=['warehouse_id', 'product_id'], how='left')
-        turnover = turnover.merge(self.products[['product_id', 'sku', 'product_name']], on='product_id')
-        turnover = turnover.merge(self.warehouses[['warehouse_id', 'warehouse_code']], on='warehouse_id')
+        turnover = turnover.join(self.products[['sku', 'product_name']], on='product_id', how='inner')
+        turnover = turnover.join(self.warehouses[['warehouse_code']], on='warehouse_id', how='inner')
         
         # Calculate metrics
         turnover['inventory_value'] = turnover['quantity_on_hand'] * turnover['unit_cost']
         turnover['cogs_annual'] = turnover['cogs_annual'].fillna(0)
         
-        # Turnover ratio = COGS / Average Inventory
-        turnover['turnover_ratio'] = np.where(
-            turnover['inventory_value'] > 0,
-            turnover['cogs_annual'] / turnover['inventory_value'],
-            0
-        )
+        # Turnover ratio = COGS / Average Inventory (0 when nothing is on hand)
+        cogs_annual = turnover['cogs_annual'].to_numpy(dtype=np.float64)
+        inventory_value = turnover['inventory_value'].to_numpy(dtype=np.float64)
+        ratio = np.divide(cogs_annual, inventory_value,
+                          out=np.zeros_like(cogs_annual), where=inventory_value > 0)
         
-        # Days of supply = 365 / turnover ratio
-        turnover['days_of_supply'] = np.where(
-            turnover['turnover_ratio'] > 0,
-            365 / turnover['turnover_ratio'],
-            np.inf
-        )
+        # Days of supply = 365 / turnover ratio (infinite when nothing sells)
+        days_of_supply = np.divide(365.0, ratio,
+                                   out=np.full_like(ratio, np.inf), where=ratio > 0)
         
-        # Classify turnover
-        def classify_turnover(ratio):
-            if ratio >= 12:
-                return 'Fast Moving'
-            elif ratio >= 4:
-                return 'Normal'
-            elif ratio >= 1:
-                return 'Slow Moving'
-            return 'Dead Stock'
+        turnover['turnover_ratio'] = ratio
+        turnover['days_of_supply'] = days_of_supply
         
-        turnover['turnover_category'] = turnover['turnover_ratio'].apply(classify_turnover)
+        # Classify turnover
+        turnover['turnover_category'] = pd.Categorical.from_codes(
+            np.select([ratio >= 12, ratio >= 4, ratio >= 1], [0, 1, 2], default=3),
+            categories=_TURNOVER_CATEGORIES, ordered=True
+        )
         
         return turnover[['warehouse_code', 'sku', 'product_name', 'quantity_on_hand',
                          'inventory_value', 'cogs_annual', 'turnover_ratio', 
@@ -212,16 +391,15 @@ class InventoryAnalytics:
         cutoff_date = self.sales_orders['order_date'].max() - timedelta(days=lookback_days)
         
         # Calculate daily demand statistics
-        recent_sales = self.sales_orders[
-            (self.sales_orders['order_date'] >= cutoff_date) & 
-            (self.sales_orders['status'] != 'Cancelled')
-        ].merge(self.sales_order_items, on='so_id')
+        recent_sales = self.sales_with_items[
+            self.sales_with_items['order_date'].to_numpy() >= cutoff_date.to_datetime64()
+        ]
         
         daily_demand = recent_sales.groupby(
-            ['warehouse_id', 'product_id', 'order_date']
+            ['warehouse_id', 'product_id', 'order_date'], observed=True, sort=False
         )['quantity_ordered'].sum().reset_index()
         
-        demand_stats = daily_demand.groupby(['warehouse_id', 'product_id']).agg({
+        demand_stats = daily_demand.groupby(['warehouse_id', 'product_id'], observed=True).agg({
             'quantity_ordered': ['mean', 'std', 'count']
         }).reset_index()
         demand_stats.columns = ['warehouse_id', 'product_id', 'avg_daily_demand', 
@@ -235,12 +413,12 @@ class InventoryAnalytics:
         # Calculate lead time statistics from POs
         delivered_pos = self.purchase_orders[
             self.purchase_orders['status'] == 'Delivered'
-        ].copy()
-        delivered_pos['actual_lead_time'] = (
-            delivered_pos['actual_delivery_date'] - delivered_pos['order_date']
-        ).dt.days
+        ]
+        delivered_pos = delivered_pos.assign(actual_lead_time=_days_between(
+            delivered_pos['order_date'], delivered_pos['actual_delivery_date']
+        ))
         
-        lead_time_stats = delivered_pos.groupby('supplier_id').agg({
+        lead_time_stats = delivered_pos.groupby('supplier_id', observed=True, sort=False).agg({
             'actual_lead_time': ['mean', 'std']
         }).reset_index()
         lead_time_stats.columns = ['supplier_id', 'avg_lead_time', 'std_lead_time']
@@ -250,43 +428,45 @@ class InventoryAnalytics:
         
         # Merge with products (use product's default lead time if no supplier data)
         result = demand_stats.merge(self.inventory, on=['warehouse_id', 'product_id'])
-        result = result.merge(self.products[['product_id', 'sku', 'product_name', 
-                                             'lead_time_days', 'unit_cost']], on='product_id')
-        result = result.merge(self.warehouses[['warehouse_id', 'warehouse_code']], on='warehouse_id')
+        result = result.join(self.products[['sku', 'product_name', 
+                                            'lead_time_days', 'unit_cost']], on='product_id', how='inner')
+        result = result.join(self.warehouses[['warehouse_code']], on='warehouse_id', how='inner')
         
         # Use default lead time if no historical data
         result['avg_lead_time'] = result['lead_time_days']
         result['std_lead_time'] = result['lead_time_days'] * 0.2
         
+        # Work on the raw float arrays to skip Series index alignment
+        lead_time = result['avg_lead_time'].to_numpy(dtype=np.float64)
+        lead_time_std = result['std_lead_time'].to_numpy(dtype=np.float64)
+        demand = result['avg_daily_demand'].to_numpy(dtype=np.float64)
+        demand_std = result['std_daily_demand'].to_numpy(dtype=np.float64)
+        
         # Calculate safety stock
         # SS = z × √(LT × σd² + d² × σLT²)
-        result['safety_stock'] = z_score * np.sqrt(
-            result['avg_lead_time'] * result['std_daily_demand']**2 +
-            result['avg_daily_demand']**2 * result['std_lead_time']**2
+        safety_stock = z_score * np.sqrt(
+            lead_time * demand_std**2 +
+            demand**2 * lead_time_std**2
         )
         
         # Calculate reorder point
-        result['calculated_rop'] = (
-            result['avg_daily_demand'] * result['avg_lead_time'] + 
-            result['safety_stock']
-        )
+        calculated_rop = demand * lead_time + safety_stock
         
         # Round to integers
-        result['safety_stock'] = result['safety_stock'].round(0).astype(int)
-        result['calculated_rop'] = result['calculated_rop'].round(0).astype(int)
+        result['safety_stock'] = np.rint(safety_stock).astype(np.int64)
+        result['calculated_rop'] = np.rint(calculated_rop).astype(np.int64)
         
         # Compare with current reorder point
         result['current_rop'] = result['reorder_point']
         result['rop_adjustment'] = result['calculated_rop'] - result['current_rop']
         
-        def recommend(row):
-            if row['rop_adjustment'] > row['current_rop'] * 0.2:
-                return 'Increase ROP'
-            elif row['rop_adjustment'] < -row['current_rop'] * 0.2:
-                return 'Decrease ROP'
-            return 'Optimal'
-        
-        result['recommendation'] = result.apply(recommend, axis=1)
+        tolerance = result['current_rop'] * 0.2
+        result['recommendation'] = pd.Categorical.from_codes(
+            np.select([result['rop_adjustment'] > tolerance,
+                       result['rop_adjustment'] < -tolerance],
+                      [0, 1], default=2),
+            categories=_ROP_RECOMMENDATIONS, ordered=True
+        )
         
         return result[['warehouse_code', 'sku', 'product_name', 'quantity_on_hand',
                        'avg_daily_demand', 'avg_lead_time', 'safety_stock',
@@ -311,28 +491,25 @@ class InventoryAnalytics:
             DataFrame with EOQ calculations
         """
         # Calculate annual demand per product
-        sales_with_items = self.sales_orders.merge(self.sales_order_items, on='so_id')
-        sales_with_items = sales_with_items[sales_with_items['status'] != 'Cancelled']
-        
-        annual_demand = sales_with_items.groupby('product_id').agg({
-            'quantity_ordered': 'sum'
-        }).reset_index()
-        annual_demand.columns = ['product_id', 'annual_demand']
+        annual_demand = self.sales_with_items.groupby('product_id', observed=True)['quantity_ordered'].sum()
+        annual_demand = annual_demand.rename('annual_demand').reset_index()
         
         # Merge with products
-        result = annual_demand.merge(
-            self.products[['product_id', 'sku', 'product_name', 'unit_cost']],
-            on='product_id'
+        result = annual_demand.join(
+            self.products[['sku', 'product_name', 'unit_cost']],
+            on='product_id', how='inner'
         )
         
         # Calculate holding cost per unit
         result['holding_cost_per_unit'] = result['unit_cost'] * holding_cost_rate
         
+        annual_demand = result['annual_demand'].to_numpy(dtype=np.float64)
+        holding_cost = result['holding_cost_per_unit'].to_numpy(dtype=np.float64)
+        
         # Calculate EOQ
-        result['eoq'] = np.sqrt(
-            2 * result['annual_demand'] * ordering_cost / 
-            result['holding_cost_per_unit']
-        ).round(0).astype(int)
+        result['eoq'] = np.rint(np.sqrt(
+            2 * annual_demand * ordering_cost / holding_cost
+        )).astype(np.int64)
         
         # Orders per year
         result['orders_per_year'] = (
@@ -345,10 +522,9 @@ class InventoryAnalytics:
         ).round(0)
         
         # Total annual inventory cost at EOQ
-        result['annual_inventory_cost'] = np.sqrt(
-            2 * result['annual_demand'] * ordering_cost * 
-            result['holding_cost_per_unit']
-        ).round(2)
+        result['annual_inventory_cost'] = np.round(np.sqrt(
+            2 * annual_demand * ordering_cost * holding_cost
+        ), 2)
         
         return result[['sku', 'product_name', 'unit_cost', 'annual_demand',
                        'eoq', 'orders_per_year', 'days_between_orders',
@@ -370,24 +546,24 @@ class InventoryAnalytics:
             DataFrame with carrying cost breakdown
         """
         # Merge inventory with products and warehouses
-        inv = self.inventory.merge(
-            self.products[['product_id', 'sku', 'unit_cost', 'category_id']],
-            on='product_id'
+        inv = self.inventory.join(
+            self.products[['sku', 'unit_cost', 'category_id']],
+            on='product_id', how='inner'
         )
-        inv = inv.merge(
-            self.warehouses[['warehouse_id', 'warehouse_code', 'warehouse_name']],
-            on='warehouse_id'
+        inv = inv.join(
+            self.warehouses[['warehouse_code', 'warehouse_name']],
+            on='warehouse_id', how='inner'
         )
         
         # Load categories
-        categories = pd.read_csv(f"{self.data_dir}/product_categories.csv")
-        inv = inv.merge(categories[['category_id', 'category_name']], on='category_id', how='left')
+        categories = _read_table(self.data_dir, 'product_categories')
+        inv = inv.join(categories[['category_name']], on='category_id', how='left')
         
         # Calculate inventory value
         inv['inventory_value'] = inv['quantity_on_hand'] * inv['unit_cost']
         
         # Aggregate by warehouse and category
-        summary = inv.groupby(['warehouse_code', 'warehouse_name', 'category_name']).agg({
+        summary = inv.groupby(['warehouse_code', 'warehouse_name', 'category_name'], observed=True).agg({
             'product_id': 'count',
             'quantity_on_hand': 'sum',
             'inventory_value': 'sum'
@@ -421,10 +597,10 @@ class SupplierAnalytics:
     
     def _load_data(self):
         """Load required datasets"""
-        self.suppliers = pd.read_csv(f"{self.data_dir}/suppliers.csv")
-        self.purchase_orders = pd.read_csv(f"{self.data_dir}/purchase_orders.csv",
-                                           parse_dates=['order_date', 'expected_delivery_date', 'actual_delivery_date'])
-        self.purchase_order_items = pd.read_csv(f"{self.data_dir}/purchase_order_items.csv")
+        self.suppliers = _read_table(self.data_dir, 'suppliers')
+        self.purchase_orders = _read_table(self.data_dir, 'purchase_orders',
+                                           parse_dates=('order_date', 'expected_delivery_date', 'actual_delivery_date'))
+        self.purchase_order_items = _read_table(self.data_dir, 'purchase_order_items')
     
     def calculate_supplier_scores(self, 
                                   lookback_days: int = 365) -> pd.DataFrame:
@@ -441,28 +617,29 @@ class SupplierAnalytics:
         """
         cutoff_date = self.purchase_orders['order_date'].max() - timedelta(days=lookback_days)
         
-        # Filter delivered orders
-        recent_pos = self.purchase_orders[
-            (self.purchase_orders['order_date'] >= cutoff_date) &
-            (self.purchase_orders['status'] == 'Delivered')
-        ].copy()
+        # Filter delivered orders (single mask built on the raw arrays)
+        recent_mask = self.purchase_orders['order_date'].to_numpy() >= cutoff_date.to_datetime64()
+        recent_mask &= (self.purchase_orders['status'] == 'Delivered').to_numpy()
+        recent_pos = self.purchase_orders[recent_mask]
         
         # Calculate delivery metrics
-        recent_pos['is_on_time'] = (
-            recent_pos['actual_delivery_date'] <= recent_pos['expected_delivery_date']
-        ).astype(int)
-        
-        recent_pos['delivery_variance'] = (
-            recent_pos['actual_delivery_date'] - recent_pos['expected_delivery_date']
-        ).dt.days
-        
-        delivery_metrics = recent_pos.groupby('supplier_id').agg({
-            'po_id': 'count',
-            'is_on_time': 'sum',
-            'delivery_variance': ['mean', 'std']
+        recent_pos = recent_pos.assign(
+            is_on_time=(
+                recent_pos['actual_delivery_date'] <= recent_pos['expected_delivery_date']
+            ).astype(np.int8),
+            delivery_variance=_days_between(
+                recent_pos['expected_delivery_date'], recent_pos['actual_delivery_date']
+            )
+        )
+        
+        # Order counts come from the group sizes rather than an agg 'count' pass
+        by_supplier = recent_pos.groupby('supplier_id', observed=True)
+        delivery_metrics = pd.DataFrame({
+            'total_orders': by_supplier.size(),
+            'on_time_orders': by_supplier['is_on_time'].sum(),
+            'avg_variance': by_supplier['delivery_variance'].mean(),
+            'std_variance': by_supplier['delivery_variance'].std()
         }).reset_index()
-        delivery_metrics.columns = ['supplier_id', 'total_orders', 'on_time_orders',
-                                    'avg_variance', 'std_variance']
         
         delivery_metrics['on_time_rate'] = (
             delivery_metrics['on_time_orders'] / delivery_metrics['total_orders'] * 100
@@ -474,7 +651,7 @@ class SupplierAnalytics:
             on='po_id'
         )
         
-        fill_metrics = po_items.groupby('supplier_id').agg({
+        fill_metrics = po_items.groupby('supplier_id', observed=True, sort=False).agg({
             'quantity_ordered': 'sum',
             'quantity_received': 'sum'
         }).reset_index()
@@ -485,22 +662,19 @@ class SupplierAnalytics:
         
         # Merge metrics
         scores = delivery_metrics.merge(fill_metrics, on='supplier_id')
-        scores = scores.merge(self.suppliers[['supplier_id', 'supplier_code', 
-                                              'supplier_name', 'quality_rating']], 
-                              on='supplier_id')
+        scores = scores.join(self.suppliers[['supplier_code', 
+                                             'supplier_name', 'quality_rating']], 
+                             on='supplier_id', how='inner')
         
         # Calculate composite score
         # On-time: 40%, Fill rate: 40%, Consistency: 20%
-        def consistency_score(variance_std):
-            if pd.isna(variance_std) or variance_std <= 1:
-                return 20
-            elif variance_std <= 3:
-                return 15
-            elif variance_std <= 7:
-                return 10
-            return 5
-        
-        scores['consistency_score'] = scores['std_variance'].apply(consistency_score)
+        # Single-delivery suppliers have no variance and get full consistency credit
+        variance_std = scores['std_variance'].fillna(0)
+        scores['consistency_score'] = np.select(
+            [variance_std <= 1, variance_std <= 3, variance_std <= 7],
+            [20, 15, 10],
+            default=5
+        )
         
         scores['reliability_score'] = (
             scores['on_time_rate'] * 0.4 +
@@ -509,16 +683,15 @@ class SupplierAnalytics:
         )
         
         # Assign tier
-        def assign_tier(row):
-            if row['on_time_rate'] >= 95 and row['fill_rate'] >= 98:
-                return 'Platinum'
-            elif row['on_time_rate'] >= 90 and row['fill_rate'] >= 95:
-                return 'Gold'
-            elif row['on_time_rate'] >= 80 and row['fill_rate'] >= 90:
-                return 'Silver'
-            return 'Bronze'
-        
-        scores['tier'] = scores.apply(assign_tier, axis=1)
+        on_time = scores['on_time_rate']
+        fill = scores['fill_rate']
+        scores['tier'] = pd.Categorical.from_codes(
+            np.select([(on_time >= 95) & (fill >= 98),
+                       (on_time >= 90) & (fill >= 95),
+                       (on_time >= 80) & (fill >= 90)],
+                      [0, 1, 2], default=3),
+            categories=_SUPPLIER_TIERS, ordered=True
+        )
         
         # Round values
         scores['on_time_rate'] = scores['on_time_rate'].round(2)
@@ -539,41 +712,38 @@ class SupplierAnalytics:
         """
         delivered = self.purchase_orders[
             self.purchase_orders['status'] == 'Delivered'
-        ].copy()
-        
-        delivered['actual_lead_time'] = (
-            delivered['actual_delivery_date'] - delivered['order_date']
-        ).dt.days
+        ]
         
-        lead_time_stats = delivered.groupby('supplier_id').agg({
-            'po_id': 'count',
-            'actual_lead_time': ['mean', 'std', 'min', 'max']
+        delivered = delivered.assign(actual_lead_time=_days_between(
+            delivered['order_date'], delivered['actual_delivery_date']
+        ))
+        
+        by_supplier = delivered.groupby('supplier_id', observed=True)
+        lead_time = by_supplier['actual_lead_time']
+        lead_time_stats = pd.DataFrame({
+            'delivery_count': by_supplier.size(),
+            'avg_lead_time': lead_time.mean(),
+            'std_lead_time': lead_time.std(),
+            'min_lead_time': lead_time.min(),
+            'max_lead_time': lead_time.max()
         }).reset_index()
-        lead_time_stats.columns = ['supplier_id', 'delivery_count', 
-                                   'avg_lead_time', 'std_lead_time',
-                                   'min_lead_time', 'max_lead_time']
         
         # Coefficient of variation
         lead_time_stats['cv_pct'] = (
             lead_time_stats['std_lead_time'] / lead_time_stats['avg_lead_time'] * 100
         )
         
-        # Reliability category
-        def classify_reliability(cv):
-            if pd.isna(cv) or cv <= 10:
-                return 'Highly Reliable'
-            elif cv <= 25:
-                return 'Reliable'
-            elif cv <= 40:
-                return 'Variable'
-            return 'Unreliable'
-        
-        lead_time_stats['reliability_category'] = lead_time_stats['cv_pct'].apply(classify_reliability)
+        # Reliability category (missing CV means a single delivery -> highly reliable)
+        lead_time_stats['reliability_category'] = pd.cut(
+            lead_time_stats['cv_pct'].fillna(0),
+            bins=[-np.inf, 10, 25, 40, np.inf],
+            labels=['Highly Reliable', 'Reliable', 'Variable', 'Unreliable']
+        )
         
         # Merge supplier info
-        lead_time_stats = lead_time_stats.merge(
-            self.suppliers[['supplier_id', 'supplier_code', 'supplier_name']],
-            on='supplier_id'
+        lead_time_stats = lead_time_stats.join(
+            self.suppliers[['supplier_code', 'supplier_name']],
+            on='supplier_id', how='inner'
         )
         
         # Round values
@@ -594,10 +764,11 @@ class DemandForecaster:
     
     def _load_data(self):
         """Load required datasets"""
-        self.sales_orders = pd.read_csv(f"{self.data_dir}/sales_orders.csv", 
-                                        parse_dates=['order_date'])
-        self.sales_order_items = pd.read_csv(f"{self.data_dir}/sales_order_items.csv")
-        self.products = pd.read_csv(f"{self.data_dir}/products.csv")
+        self.sales_orders = _read_table(self.data_dir, 'sales_orders',
+                                        parse_dates=('order_date',))
+        self.sales_order_items = _read_table(self.data_dir, 'sales_order_items')
+        self.products = _read_table(self.data_dir, 'products')
+        self.sales_with_items = _read_active_sales(self.data_dir)
     
     def prepare_demand_data(self, 
                             product_id: Optional[int] = None,
@@ -612,9 +783,7 @@ class DemandForecaster:
         Returns:
             DataFrame with daily demand
         """
-        # Join orders with items
-        demand = self.sales_orders.merge(self.sales_order_items, on='so_id')
-        demand = demand[demand['status'] != 'Cancelled']
+        demand = self.sales_with_items
         
         # Apply filters
         if product_id:
@@ -624,7 +793,7 @@ class DemandForecaster:
         
         # Aggregate by date and product
         daily_demand = demand.groupby(
-            ['order_date', 'product_id']
+            ['order_date', 'product_id'], observed=True
         )['quantity_ordered'].sum().reset_index()
         
         return daily_demand
@@ -649,14 +818,8 @@ class DemandForecaster:
         if len(demand) == 0:
             return pd.DataFrame()
         
-        # Create complete date range
-        date_range = pd.date_range(
-            demand['order_date'].min(),
-            demand['order_date'].max()
-        )
-        
-        daily = demand.set_index('order_date').reindex(date_range, fill_value=0)
-        daily['quantity_ordered'] = daily['quantity_ordered'].fillna(0)
+        # Daily series over the complete date range (days without sales -> 0)
+        daily = demand.set_index('order_date')['quantity_ordered'].resample('D').sum().to_frame()
         
         # Calculate moving average
         daily['ma'] = daily['quantity_ordered'].rolling(window=window, min_periods=1).mean()
@@ -696,23 +859,12 @@ class DemandForecaster:
         if len(demand) == 0:
             return pd.DataFrame()
         
-        # Create complete date range
-        date_range = pd.date_range(
-            demand['order_date'].min(),
-            demand['order_date'].max()
-        )
-        
-        daily = demand.set_index('order_date').reindex(date_range, fill_value=0)
-        daily['quantity_ordered'] = daily['quantity_ordered'].fillna(0)
+        # Daily series over the complete date range (days without sales -> 0)
+        daily = demand.set_index('order_date')['quantity_ordered'].resample('D').sum().to_frame()
         
         # Calculate exponential smoothing
-        values = daily['quantity_ordered'].values
-        smoothed = [values[0]]
-        
-        for i in range(1, len(values)):
-            smoothed.append(alpha * values[i] + (1 - alpha) * smoothed[-1])
-        
-        daily['smoothed'] = smoothed
+        # adjust=False gives the recursive form: s[t] = alpha * x[t] + (1 - alpha) * s[t-1]
+        daily['smoothed'] = daily['quantity_ordered'].ewm(alpha=alpha, adjust=False).mean()
         
         # Forecast
         last_smoothed = daily['smoothed'].iloc[-1]
@@ -728,6 +880,79 @@ class DemandForecaster:
         })
         
         return forecast
+    
+    def forecast_all(self,
+                     product_ids: Optional[List[int]] = None,
+                     method: str = 'exponential_smoothing',
+                     max_workers: Optional[int] = None,
+                     **method_kwargs) -> pd.DataFrame:
+        """
+        Forecast many products in parallel across worker processes.
+        
+        Each worker builds its own forecaster once (served from the Parquet
+        cache) and then handles a batch of products.
+        
+        Args:
+            product_ids: Products to forecast (defaults to all products)
+            method: 'moving_average' or 'exponential_smoothing'
+            max_workers: Number of worker processes (defaults to CPU count)
+            **method_kwargs: Extra arguments for the forecasting method
+            
+        Returns:
+            DataFrame with forecasts for every product, keyed by product_id
+        """
+        if method not in _FORECAST_METHODS:
+            raise ValueError(f"Unknown forecasting method: {method}")
+        
+        if product_ids is None:
+            product_ids = self.products.index.tolist()
+        
+        worker = partial(_forecast_product, method=method, **method_kwargs)
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_forecast_worker,
+                                 initargs=(self.data_dir,)) as pool:
+            forecasts = list(pool.map(worker, product_ids, chunksize=16))
+        
+        forecasts = [f for f in forecasts if len(f) > 0]
+        if not forecasts:
+            return pd.DataFrame()
+        return pd.concat(forecasts, ignore_index=True)
+
+
+# Forecaster owned by each forecast_all worker process
+_worker_forecaster: Optional[DemandForecaster] = None
+
+_FORECAST_METHODS = {
+    'moving_average': 'moving_average_forecast',
+    'exponential_smoothing': 'exponential_smoothing_forecast',
+}
+
+
+def _init_forecast_worker(data_dir: str):
+    """Load the forecaster once per worker process"""
+    global _worker_forecaster
+    _worker_forecaster = DemandForecaster(data_dir)
+
+
+def _forecast_product(product_id: int, method: str, **method_kwargs) -> pd.DataFrame:
+    """Forecast a single product inside a worker process"""
+    forecast_fn = getattr(_worker_forecaster, _FORECAST_METHODS[method])
+    forecast = forecast_fn(product_id, **method_kwargs)
+    if len(forecast) > 0:
+        forecast.insert(0, 'product_id', product_id)
+    return forecast
+
+
+def _cached_on_events(method):
+    """Memoize a StockoutAnalyzer analysis until `stockout_events` is replaced"""
+    @wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._results:
+            self._results[method.__name__] = method(self)
+        # Deep copy: without copy-on-write (pandas < 3) a shallow copy still shares
+        # the cached buffers, so in-place edits by callers would leak into the cache
+        return self._results[method.__name__].copy()
+    return wrapper
 
 
 class StockoutAnalyzer:
@@ -739,11 +964,36 @@ class StockoutAnalyzer:
     
     def _load_data(self):
         """Load required datasets"""
-        self.stockout_events = pd.read_csv(f"{self.data_dir}/stockout_events.csv",
-                                           parse_dates=['stockout_start_date', 'stockout_end_date'])
-        self.products = pd.read_csv(f"{self.data_dir}/products.csv")
-        self.warehouses = pd.read_csv(f"{self.data_dir}/warehouses.csv")
+        self.products = _read_table(self.data_dir, 'products')
+        self.warehouses = _read_table(self.data_dir, 'warehouses')
+        self.stockout_events = _read_table(self.data_dir, 'stockout_events',
+                                           parse_dates=('stockout_start_date', 'stockout_end_date'))
+        
+        # Attribute arrays aligned with the product/warehouse indexes, gathered by position
+        self._sku_values = self.products['sku'].to_numpy()
+        self._product_name_values = self.products['product_name'].to_numpy()
+        self._warehouse_code_values = self.warehouses['warehouse_code'].to_numpy()
     
+    @property
+    def stockout_events(self) -> pd.DataFrame:
+        """Stockout event table with derived duration_days"""
+        return self._stockout_events
+    
+    @stockout_events.setter
+    def stockout_events(self, events: pd.DataFrame):
+        """Replace the event table, rebuilding groupings and dropping cached results"""
+        self._stockout_events = events.assign(duration_days=_days_between(
+            events['stockout_start_date'],
+            events['stockout_end_date']
+        ))
+        
+        # Group keys are factorized once here and reused by every analysis call
+        self._impact_groups = self._stockout_events.groupby(
+            ['warehouse_id', 'product_id'], observed=True, sort=False, as_index=False
+        )
+        self._results = {}
+    
+    @_cached_on_events
     def analyze_stockout_impact(self) -> pd.DataFrame:
         """
         Analyze stockout frequency and financial impact.
@@ -751,46 +1001,64 @@ class StockoutAnalyzer:
         Returns:
             DataFrame with stockout analysis by product
         """
-        stockouts = self.stockout_events.copy()
-        stockouts['duration_days'] = (
-            stockouts['stockout_end_date'] - stockouts['stockout_start_date']
-        ).dt.days
-        
-        impact = stockouts.groupby(['warehouse_id', 'product_id']).agg({
-            'stockout_id': 'count',
-            'duration_days': 'mean',
-            'demand_during_stockout': 'sum',
-            'lost_sales_amount': 'sum'
-        }).reset_index()
-        impact.columns = ['warehouse_id', 'product_id', 'stockout_count',
-                         'avg_duration_days', 'total_lost_units', 'total_lost_revenue']
-        
-        # Add product and warehouse info
-        impact = impact.merge(
-            self.products[['product_id', 'sku', 'product_name']],
-            on='product_id'
-        )
-        impact = impact.merge(
-            self.warehouses[['warehouse_id', 'warehouse_code']],
-            on='warehouse_id'
-        )
-        
-        # Calculate severity score
-        impact['severity_score'] = (
-            impact['stockout_count'] * 30 +
-            impact['avg_duration_days'] * 10 +
-            impact['total_lost_revenue'] / 100
+        impact = self._impact_groups.agg(
+            stockout_count=('stockout_id', 'size'),
+            avg_duration_days=('duration_days', 'mean'),
+            total_lost_units=('demand_during_stockout', 'sum'),
+            total_lost_revenue=('lost_sales_amount', 'sum')
         )
         
-        # Round values
-        impact['avg_duration_days'] = impact['avg_duration_days'].round(1)
-        impact['total_lost_revenue'] = impact['total_lost_revenue'].round(2)
-        impact['severity_score'] = impact['severity_score'].round(0)
-        
-        return impact[['warehouse_code', 'sku', 'product_name', 'stockout_count',
-                       'avg_duration_days', 'total_lost_units', 'total_lost_revenue',
-                       'severity_score']].sort_values('severity_score', ascending=False)
+        # Work on plain column arrays from here; the frame is built once at the end
+        stockout_count = impact['stockout_count'].to_numpy().astype(np.int32)
+        avg_duration_days = impact['avg_duration_days'].to_numpy(dtype=np.float64)
+        total_lost_units = impact['total_lost_units'].to_numpy()
+        total_lost_revenue = impact['total_lost_revenue'].to_numpy(dtype=np.float64)
+        
+        # Row positions in the id-indexed product and warehouse tables; groups whose
+        # product or warehouse is unknown are dropped, as with an inner join
+        product_rows = self.products.index.get_indexer(impact['product_id'])
+        warehouse_rows = self.warehouses.index.get_indexer(impact['warehouse_id'])
+        keep = (product_rows >= 0) & (warehouse_rows >= 0)
+        if not keep.all():
+            product_rows, warehouse_rows = product_rows[keep], warehouse_rows[keep]
+            stockout_count, avg_duration_days = stockout_count[keep], avg_duration_days[keep]
+            total_lost_units, total_lost_revenue = total_lost_units[keep], total_lost_revenue[keep]
+        
+        # Calculate severity score: two buffers total, rounded in place
+        severity_score = np.multiply(stockout_count, 30.0)
+        scratch = np.multiply(avg_duration_days, 10.0)
+        severity_score += scratch
+        np.divide(total_lost_revenue, 100.0, out=scratch)
+        severity_score += scratch
+        np.round(severity_score, out=severity_score)
+        
+        # Whole-number score; only widen if lost revenue pushes it past int32. Groups of
+        # ongoing stockouts have no duration and keep a NaN score, so stay float then
+        if np.isfinite(severity_score).all():
+            if severity_score.max(initial=0) <= np.iinfo(np.int32).max:
+                severity_score = severity_score.astype(np.int32)
+            else:
+                severity_score = severity_score.astype(np.int64)
+        
+        # Most severe first; stable argsort keeps ties in group order
+        order = np.argsort(-severity_score, kind='stable')
+        product_rows = product_rows[order]
+        warehouse_rows = warehouse_rows[order]
+        
+        # Every row position is valid after the filter above, so a plain gather suffices
+        return pd.DataFrame({
+            'warehouse_code': self._warehouse_code_values[warehouse_rows],
+            'sku': self._sku_values[product_rows],
+            'product_name': self._product_name_values[product_rows],
+            'stockout_count': stockout_count[order],
+            # Counts/durations are narrowed for output; money stays float64 for cents
+            'avg_duration_days': np.round(avg_duration_days, 1).astype(np.float32)[order],
+            'total_lost_units': total_lost_units[order],
+            'total_lost_revenue': np.round(total_lost_revenue, 2)[order],
+            'severity_score': severity_score[order]
+        })
     
+    @_cached_on_events
     def get_root_cause_analysis(self) -> pd.DataFrame:
         """
         Analyze stockout root causes.
@@ -798,23 +1066,45 @@ class StockoutAnalyzer:
         Returns:
             DataFrame with root cause distribution
         """
-        cause_analysis = self.stockout_events.groupby('root_cause').agg({
-            'stockout_id': 'count',
-            'lost_sales_amount': 'sum',
-            'demand_during_stockout': 'sum'
-        }).reset_index()
-        cause_analysis.columns = ['root_cause', 'occurrence_count', 
-                                  'total_lost_revenue', 'total_lost_units']
-        
-        # Calculate percentage
-        total_events = cause_analysis['occurrence_count'].sum()
-        cause_analysis['pct_of_stockouts'] = (
-            cause_analysis['occurrence_count'] / total_events * 100
-        ).round(2)
+        # Single-pass reductions over the categorical codes (missing causes skipped)
+        root_cause = self.stockout_events['root_cause']
+        codes = root_cause.cat.codes.to_numpy()
+        known = codes >= 0
+        codes = codes[known]
+        n_causes = len(root_cause.cat.categories)
+        
+        occurrence_count = np.bincount(codes, minlength=n_causes)
+        total_lost_revenue = np.bincount(
+            codes,
+            weights=self.stockout_events['lost_sales_amount'].to_numpy(dtype=np.float64)[known],
+            minlength=n_causes
+        )
+        total_lost_units = np.bincount(
+            codes,
+            weights=self.stockout_events['demand_during_stockout'].to_numpy(dtype=np.float64)[known],
+            minlength=n_causes
+        ).astype(np.int64)
+        
+        # Calculate percentage (one scalar factor broadcast over the counts)
+        total_events = codes.shape[0]
+        pct_of_stockouts = occurrence_count * (100.0 / total_events)
+        
+        observed = occurrence_count > 0
+        cause_analysis = pd.DataFrame({
+            'root_cause': root_cause.cat.categories[observed],
+            'occurrence_count': occurrence_count[observed],
+            'total_lost_revenue': total_lost_revenue[observed],
+            'total_lost_units': total_lost_units[observed],
+            'pct_of_stockouts': pct_of_stockouts[observed]
+        })
         
-        cause_analysis['total_lost_revenue'] = cause_analysis['total_lost_revenue'].round(2)
+        cause_analysis = cause_analysis.round({
+            'pct_of_stockouts': 2,
+            'total_lost_revenue': 2
+        })
         
-        return cause_analysis.sort_values('occurrence_count', ascending=False)
+        order = np.argsort(-cause_analysis['occurrence_count'].to_numpy(), kind='stable')
+        return cause_analysis.iloc[order]
 
 
 if __name__ == "__main__":
@@ -823,32 +1113,33 @@ if __name__ == "__main__":
     print("SUPPLY CHAIN ANALYTICS ENGINE")
     print("="*60)
     
-    # Initialize analytics
+    # Initialize analytics (tables are loaded once and shared by all engines)
     inv_analytics = InventoryAnalytics()
     supplier_analytics = SupplierAnalytics()
     stockout_analyzer = StockoutAnalyzer()
     
     # Run analyses
+    abc = inv_analytics.calculate_abc_classification()
+    supplier_scores = supplier_analytics.calculate_supplier_scores()
+    root_causes = stockout_analyzer.get_root_cause_analysis()
+    carrying = inv_analytics.calculate_carrying_costs()
+    
     print("\n1. ABC Classification")
     print("-"*40)
-    abc = inv_analytics.calculate_abc_classification()
-    print(abc.groupby('abc_class').agg({
+    print(abc.groupby('abc_class', observed=True).agg({
         'product_id': 'count',
         'total_revenue': 'sum'
     }))
     
     print("\n2. Top Suppliers by Reliability")
     print("-"*40)
-    supplier_scores = supplier_analytics.calculate_supplier_scores()
     print(supplier_scores.head(10)[['supplier_name', 'reliability_score', 'tier']])
     
     print("\n3. Stockout Root Causes")
     print("-"*40)
-    root_causes = stockout_analyzer.get_root_cause_analysis()
     print(root_causes)
     
     print("\n4. Inventory Carrying Costs Summary")
     print("-"*40)
-    carrying = inv_analytics.calculate_carrying_costs()
-    warehouse_total = carrying.groupby('warehouse_code')['total_carrying_cost'].sum()
+    warehouse_total = carrying.groupby('warehouse_code', observed=True)['total_carrying_cost'].sum()
     print(warehouse_total)
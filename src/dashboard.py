@@ -9,9 +9,9 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -20,7 +20,8 @@ from src.analytics import (
     InventoryAnalytics, 
     SupplierAnalytics, 
     StockoutAnalyzer,
-    DemandForecaster
+    DemandForecaster,
+    read_cached_table
 )
 
 # Page config
@@ -50,73 +51,168 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Date columns parsed from the CSVs; the Parquet cache stores them as timestamps
+DATE_COLUMNS = {
+    'sales_orders': ('order_date',),
+    'purchase_orders': ('order_date', 'expected_delivery_date', 'actual_delivery_date'),
+    'stockout_events': ('stockout_start_date', 'stockout_end_date'),
+}
+
+
 @st.cache_data
 def load_data(data_dir: str = "data"):
-    """Load all datasets with caching"""
+    """Load the datasets the dashboard views read, with caching (served from the Parquet copies when fresh)"""
     data = {}
+    # Only tables some view reads are held in memory; the large transaction, forecast
+    # and order-line tables are consumed by the analytics engines, not the views
     files = [
-        'warehouses', 'products', 'suppliers', 'customers',
-        'purchase_orders', 'purchase_order_items',
-        'sales_orders', 'sales_order_items',
-        'inventory', 'inventory_transactions',
-        'stockout_events', 'demand_forecasts', 'product_categories'
+        'warehouses', 'products', 'suppliers',
+        'purchase_order_items', 'sales_orders',
+        'inventory', 'stockout_events'
     ]
     
-    for file in files:
-        filepath = f"{data_dir}/{file}.csv"
-        if os.path.exists(filepath):
-            data[file] = pd.read_csv(filepath)
-    
-    # Parse dates
-    if 'sales_orders' in data:
-        data['sales_orders']['order_date'] = pd.to_datetime(data['sales_orders']['order_date'])
-    if 'purchase_orders' in data:
-        for col in ['order_date', 'expected_delivery_date', 'actual_delivery_date']:
-            data['purchase_orders'][col] = pd.to_datetime(data['purchase_orders'][col])
+    files = [file for file in files if os.path.exists(f"{data_dir}/{file}.csv")]
+    
+    # The Arrow readers release the GIL, so the tables load concurrently
+    with ThreadPoolExecutor() as pool:
+        frames = pool.map(
+            lambda file: read_cached_table(data_dir, file, parse_dates=DATE_COLUMNS.get(file, ())),
+            files
+        )
+        for file, df in zip(files, frames):
+            # Ids and quantities all fit in int32, halving the bytes every reduction reads
+            data[file] = df.astype({col: np.int32 for col, dtype in df.dtypes.items()
+                                    if pd.api.types.is_integer_dtype(dtype)})
+    
+    # Stockout durations are derived once here instead of on every render
     if 'stockout_events' in data:
-        data['stockout_events']['stockout_start_date'] = pd.to_datetime(data['stockout_events']['stockout_start_date'])
-        data['stockout_events']['stockout_end_date'] = pd.to_datetime(data['stockout_events']['stockout_end_date'])
+        events = data['stockout_events']
+        events['duration_days'] = (events['stockout_end_date'] - events['stockout_start_date']).dt.days
     
     return data
 
 
+# Analytics engine classes by name; each is constructed only when a page needs it
+ENGINES = {
+    'inventory': InventoryAnalytics,
+    'supplier': SupplierAnalytics,
+    'stockout': StockoutAnalyzer,
+    'forecaster': DemandForecaster
+}
+
+
 @st.cache_resource
-def get_analytics(data_dir: str = "data"):
-    """Initialize analytics engines with caching"""
-    return {
-        'inventory': InventoryAnalytics(data_dir),
-        'supplier': SupplierAnalytics(data_dir),
-        'stockout': StockoutAnalyzer(data_dir),
-        'forecaster': DemandForecaster(data_dir)
-    }
+def get_engine(data_dir: str, engine: str):
+    """Initialize a single analytics engine with caching"""
+    return ENGINES[engine](data_dir)
+
+
+@st.cache_data
+def run_analysis(data_dir: str, engine: str, method: str, **params) -> pd.DataFrame:
+    """Run an analytics method once per data directory and parameter set, so reruns reuse it"""
+    return getattr(get_engine(data_dir, engine), method)(**params)
+
+
+@st.cache_data
+def inventory_values(data_dir: str) -> np.ndarray:
+    """Value (quantity on hand x unit cost) of every inventory row, via an indexed cost lookup"""
+    data = load_data(data_dir)
+    products = data['products']
+    # Index just the cost column; set_index would copy the whole products frame
+    unit_cost_by_id = pd.Series(products['unit_cost'].to_numpy(), index=products['product_id'].to_numpy())
+    inv = data['inventory']
+    qty = inv['quantity_on_hand'].to_numpy(dtype=np.float64)
+    costs = inv['product_id'].map(unit_cost_by_id).to_numpy(dtype=np.float64)
+    return qty * costs
+
+
+# Currency columns keep their numeric dtype (so they sort by value); the frontend formats them
+MONEY_COLUMN = st.column_config.NumberColumn(format="$%.2f")
+
+# Above this many points scatter plots are replaced by a binned density view
+SCATTER_POINT_LIMIT = 10_000
+
+
+@st.cache_data
+def density_heatmap(x: np.ndarray, y: np.ndarray, title: str, bins: int = 60) -> go.Figure:
+    """Rasterize a point cloud into a 2D count grid so the browser draws a fixed-size image"""
+    finite = np.isfinite(x) & np.isfinite(y)
+    counts, x_edges, y_edges = np.histogram2d(x[finite], y[finite], bins=bins)
+    fig = go.Figure(go.Heatmap(
+        x=(x_edges[:-1] + x_edges[1:]) / 2,
+        y=(y_edges[:-1] + y_edges[1:]) / 2,
+        z=np.where(counts > 0, counts, np.nan).T,
+        colorscale='Viridis',
+        colorbar=dict(title="Products")
+    ))
+    fig.update_layout(title=title)
+    return fig
+
 
+@st.cache_data
+def monthly_sales(data_dir: str) -> pd.DataFrame:
+    """Total sales per calendar month (months floored on the datetime64 buffer, no Period boxing)"""
+    sales = load_data(data_dir)['sales_orders']
+    month = sales['order_date'].to_numpy().astype('datetime64[M]')
+    return pd.DataFrame({
+        'month': month,
+        'total_amount': sales['total_amount'].to_numpy()
+    }).groupby('month', as_index=False)['total_amount'].sum()
+
+
+def top_and_bottom(df: pd.DataFrame, column: str, n: int):
+    """
+    Highest and lowest `n` rows by `column` (each best/worst first), like
+    `nlargest`/`nsmallest`: missing values are skipped and ties keep row order.
+    """
+    values = df[column].to_numpy(dtype=np.float64)
+    rows = np.flatnonzero(np.isfinite(values))
+    values = values[rows]
+    # Stable sorts on the values and their negation keep the first of tied rows first
+    top = rows[np.argsort(-values, kind='stable')[:n]]
+    bottom = rows[np.argsort(values, kind='stable')[:n]]
+    return df.iloc[top], df.iloc[bottom]
+
+
+@st.cache_data
+def binned_histogram(values: np.ndarray, bins: int, title: str, color: str) -> go.Figure:
+    """Histogram binned with numpy, so only the bin counts are sent to the browser"""
+    values = values[np.isfinite(values)]
+    counts, edges = np.histogram(values, bins=bins)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color=color
+    ))
+    fig.update_layout(title=title, bargap=0)
+    return fig
 
-def render_kpis(data: dict):
+
+def render_kpis(data_dir: str, data: dict):
     """Render top-level KPI metrics"""
     st.subheader("📊 Key Performance Indicators")
     
     col1, col2, col3, col4, col5 = st.columns(5)
     
     # Total inventory value
-    inv = data['inventory'].merge(
-        data['products'][['product_id', 'unit_cost']], 
-        on='product_id'
-    )
-    total_inv_value = (inv['quantity_on_hand'] * inv['unit_cost']).sum()
+    inv = data['inventory']
+    total_inv_value = np.nansum(inventory_values(data_dir))
     
     # Total stockout losses
     stockout_losses = data['stockout_events']['lost_sales_amount'].sum()
     
     # Fill rate
     po_items = data['purchase_order_items']
-    fill_rate = po_items['quantity_received'].sum() / po_items['quantity_ordered'].sum() * 100
+    fill_rate = (po_items['quantity_received'].to_numpy().sum() /
+                 po_items['quantity_ordered'].to_numpy().sum() * 100)
     
-    # Active suppliers
-    active_suppliers = len(data['suppliers'][data['suppliers']['is_active'] == True])
+    # Active suppliers (counted on the flag array, no filtered frame)
+    active_suppliers = int(data['suppliers']['is_active'].sum())
     
     # Products at risk (below reorder point)
-    inv['available'] = inv['quantity_on_hand'] - inv['quantity_reserved']
-    at_risk = len(inv[inv['available'] < inv['reorder_point']])
+    available = inv['quantity_on_hand'].to_numpy() - inv['quantity_reserved'].to_numpy()
+    at_risk = int(np.count_nonzero(available < inv['reorder_point'].to_numpy()))
     
     with col1:
         st.metric("Total Inventory Value", f"${total_inv_value:,.0f}")
@@ -130,17 +226,46 @@ def render_kpis(data: dict):
         st.metric("Products at Risk", at_risk, delta=f"{at_risk} below ROP", delta_color="inverse")
 
 
-def render_abc_analysis(analytics: dict):
+@st.cache_data
+def abc_distribution_figure(classes: tuple, revenue: tuple, products: tuple) -> go.Figure:
+    """Revenue and product-count donuts per ABC class, cached on the class totals"""
+    # Only this chart draws subplots; import on first use rather than at startup
+    from plotly.subplots import make_subplots
+    
+    fig = make_subplots(rows=1, cols=2, specs=[[{"type": "pie"}, {"type": "pie"}]],
+                       subplot_titles=("Revenue Distribution", "Product Distribution"))
+    
+    colors = {'A': '#2E86AB', 'B': '#A23B72', 'C': '#F18F01'}
+    
+    fig.add_trace(
+        go.Pie(labels=classes, values=revenue, 
+               marker_colors=[colors[c] for c in classes],
+               hole=0.4, name="Revenue"),
+        row=1, col=1
+    )
+    
+    fig.add_trace(
+        go.Pie(labels=classes, values=products,
+               marker_colors=[colors[c] for c in classes],
+               hole=0.4, name="Products"),
+        row=1, col=2
+    )
+    
+    fig.update_layout(height=350, showlegend=True)
+    return fig
+
+
+def render_abc_analysis(data_dir: str):
     """Render ABC Classification analysis"""
     st.subheader("🏷️ ABC Classification Analysis")
     
-    abc_data = analytics['inventory'].calculate_abc_classification()
+    abc_data = run_analysis(data_dir, 'inventory', 'calculate_abc_classification')
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Summary by class
-        summary = abc_data.groupby('abc_class').agg({
+        summary = abc_data.groupby('abc_class', observed=True).agg({
             'product_id': 'count',
             'total_revenue': 'sum'
         }).reset_index()
@@ -148,36 +273,19 @@ def render_abc_analysis(analytics: dict):
         summary['Revenue %'] = summary['Revenue'] / summary['Revenue'].sum() * 100
         summary['Products %'] = summary['Products'] / summary['Products'].sum() * 100
         
-        fig = make_subplots(rows=1, cols=2, specs=[[{"type": "pie"}, {"type": "pie"}]],
-                           subplot_titles=("Revenue Distribution", "Product Distribution"))
-        
-        colors = {'A': '#2E86AB', 'B': '#A23B72', 'C': '#F18F01'}
-        
-        fig.add_trace(
-            go.Pie(labels=summary['Class'], values=summary['Revenue'], 
-                   marker_colors=[colors[c] for c in summary['Class']],
-                   hole=0.4, name="Revenue"),
-            row=1, col=1
-        )
-        
-        fig.add_trace(
-            go.Pie(labels=summary['Class'], values=summary['Products'],
-                   marker_colors=[colors[c] for c in summary['Class']],
-                   hole=0.4, name="Products"),
-            row=1, col=2
-        )
-        
-        fig.update_layout(height=350, showlegend=True)
+        fig = abc_distribution_figure(tuple(summary['Class']), tuple(summary['Revenue']),
+                                      tuple(summary['Products']))
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Class metrics table
         st.markdown("**Class Summary**")
-        summary_display = summary.copy()
-        summary_display['Revenue'] = summary_display['Revenue'].apply(lambda x: f"${x:,.0f}")
-        summary_display['Revenue %'] = summary_display['Revenue %'].apply(lambda x: f"{x:.1f}%")
-        summary_display['Products %'] = summary_display['Products %'].apply(lambda x: f"{x:.1f}%")
-        st.dataframe(summary_display, use_container_width=True, hide_index=True)
+        st.dataframe(summary, use_container_width=True, hide_index=True,
+                     column_config={
+                         'Revenue': st.column_config.NumberColumn(format="$%.0f"),
+                         'Revenue %': st.column_config.NumberColumn(format="%.1f%%"),
+                         'Products %': st.column_config.NumberColumn(format="%.1f%%")
+                     })
         
         st.markdown("""
         **Insights:**
@@ -189,210 +297,290 @@ def render_abc_analysis(analytics: dict):
     # Top A-class products
     st.markdown("**Top A-Class Products by Revenue**")
     top_a = abc_data[abc_data['abc_class'] == 'A'].head(10)
-    top_a['total_revenue'] = top_a['total_revenue'].apply(lambda x: f"${x:,.2f}")
     st.dataframe(top_a[['sku', 'product_name', 'quantity_ordered', 'total_revenue']], 
-                 use_container_width=True, hide_index=True)
+                 use_container_width=True, hide_index=True,
+                 column_config={'total_revenue': MONEY_COLUMN})
+
+
+# Category colors as (label, color) pairs, so they can be part of a cache key
+TURNOVER_COLORS = (
+    ('Fast Moving', '#28a745'),
+    ('Normal', '#17a2b8'),
+    ('Slow Moving', '#ffc107'),
+    ('Dead Stock', '#dc3545')
+)
+
+
+def column_tuples(df: pd.DataFrame, columns: list) -> tuple:
+    """Columns of `df` as hashable tuples, the cache key for the figure helpers below"""
+    return tuple(tuple(df[col].tolist()) for col in columns)
+
+
+@st.cache_data
+def category_bar_figure(labels: tuple, counts: tuple, colors: tuple, title: str,
+                        x_title: str, y_title: str) -> go.Figure:
+    """Count per category as colored bars; `colors` holds (label, color) pairs"""
+    fig = px.bar(
+        x=list(labels),
+        y=list(counts),
+        color=list(labels),
+        color_discrete_map=dict(colors),
+        title=title
+    )
+    fig.update_layout(showlegend=False, xaxis_title=x_title, yaxis_title=y_title)
+    return fig
+
+
+@st.cache_data
+def turnover_scatter_figure(ratio: tuple, value: tuple, category: tuple,
+                            sku: tuple, name: tuple) -> go.Figure:
+    """Turnover ratio vs inventory value for a sample of products"""
+    sample = pd.DataFrame({
+        'turnover_ratio': ratio,
+        'inventory_value': value,
+        'turnover_category': category,
+        'sku': sku,
+        'product_name': name
+    })
+    # WebGL keeps the scatter responsive
+    return px.scatter(
+        sample,
+        x='turnover_ratio',
+        y='inventory_value',
+        color='turnover_category',
+        hover_data=['sku', 'product_name'],
+        render_mode='webgl',
+        title="Turnover Ratio vs Inventory Value",
+        color_discrete_map=dict(TURNOVER_COLORS),
+        category_orders={'turnover_category': [category for category, _ in TURNOVER_COLORS]}
+    )
 
 
-def render_inventory_turnover(analytics: dict):
+def render_inventory_turnover(data_dir: str):
     """Render inventory turnover analysis"""
     st.subheader("🔄 Inventory Turnover Analysis")
     
-    turnover_data = analytics['inventory'].calculate_inventory_turnover()
+    turnover_data = run_analysis(data_dir, 'inventory', 'calculate_inventory_turnover')
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Turnover distribution
-        category_counts = turnover_data['turnover_category'].value_counts()
-        fig = px.bar(
-            x=category_counts.index, 
-            y=category_counts.values,
-            color=category_counts.index,
-            color_discrete_map={
-                'Fast Moving': '#28a745',
-                'Normal': '#17a2b8',
-                'Slow Moving': '#ffc107',
-                'Dead Stock': '#dc3545'
-            },
-            title="Products by Turnover Category"
-        )
-        fig.update_layout(showlegend=False, xaxis_title="Category", yaxis_title="Product Count")
+        category_counts = turnover_data['turnover_category'].value_counts(sort=False)
+        fig = category_bar_figure(tuple(category_counts.index), tuple(category_counts.tolist()),
+                                  TURNOVER_COLORS, "Products by Turnover Category",
+                                  "Category", "Product Count")
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
-        # Turnover vs Inventory Value scatter
-        sample = turnover_data.sample(min(200, len(turnover_data)))
-        fig = px.scatter(
-            sample,
-            x='turnover_ratio',
-            y='inventory_value',
-            color='turnover_category',
-            hover_data=['sku', 'product_name'],
-            title="Turnover Ratio vs Inventory Value",
-            color_discrete_map={
-                'Fast Moving': '#28a745',
-                'Normal': '#17a2b8',
-                'Slow Moving': '#ffc107',
-                'Dead Stock': '#dc3545'
-            }
-        )
+        if len(turnover_data) > SCATTER_POINT_LIMIT:
+            # Too many products to draw individually: bin them all server-side
+            fig = density_heatmap(
+                turnover_data['turnover_ratio'].to_numpy(),
+                turnover_data['inventory_value'].to_numpy(),
+                title="Turnover Ratio vs Inventory Value (all products)"
+            )
+        else:
+            # Turnover vs Inventory Value scatter
+            # A fixed sample keeps the figure's cache key stable across reruns
+            plot_cols = ['turnover_ratio', 'inventory_value', 'turnover_category', 'sku', 'product_name']
+            sample = turnover_data[plot_cols].sample(min(200, len(turnover_data)), random_state=0)
+            fig = turnover_scatter_figure(*column_tuples(sample, plot_cols))
         fig.update_layout(xaxis_title="Turnover Ratio", yaxis_title="Inventory Value ($)")
         st.plotly_chart(fig, use_container_width=True)
     
-    # Metrics
+    # Metrics (one dead-stock mask shared by the counts, totals and detail table)
+    is_dead = (turnover_data['turnover_category'] == 'Dead Stock').to_numpy()
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         avg_turnover = turnover_data['turnover_ratio'].mean()
         st.metric("Average Turnover Ratio", f"{avg_turnover:.2f}")
     with col2:
-        avg_dos = turnover_data[turnover_data['days_of_supply'] < np.inf]['days_of_supply'].mean()
+        days_of_supply = turnover_data['days_of_supply'].to_numpy()
+        avg_dos = days_of_supply[days_of_supply < np.inf].mean()
         st.metric("Average Days of Supply", f"{avg_dos:.0f}")
     with col3:
-        dead_stock = len(turnover_data[turnover_data['turnover_category'] == 'Dead Stock'])
+        dead_stock = int(is_dead.sum())
         st.metric("Dead Stock Items", dead_stock)
     with col4:
-        dead_value = turnover_data[turnover_data['turnover_category'] == 'Dead Stock']['inventory_value'].sum()
+        dead_value = turnover_data['inventory_value'].to_numpy()[is_dead].sum()
         st.metric("Dead Stock Value", f"${dead_value:,.0f}")
     
     # Dead stock details
     if st.checkbox("Show Dead Stock Details"):
-        dead_items = turnover_data[turnover_data['turnover_category'] == 'Dead Stock']
-        dead_items = dead_items.sort_values('inventory_value', ascending=False)
-        dead_items['inventory_value'] = dead_items['inventory_value'].apply(lambda x: f"${x:,.2f}")
+        dead_items = turnover_data[is_dead].nlargest(20, 'inventory_value')
         st.dataframe(dead_items[['warehouse_code', 'sku', 'product_name', 'quantity_on_hand', 
-                                 'inventory_value', 'days_of_supply']].head(20), 
-                     use_container_width=True, hide_index=True)
+                                 'inventory_value', 'days_of_supply']], 
+                     use_container_width=True, hide_index=True,
+                     column_config={'inventory_value': MONEY_COLUMN})
+
+
+TIER_COLORS = (
+    ('Platinum', '#C0C0C0'),
+    ('Gold', '#FFD700'),
+    ('Silver', '#A8A8A8'),
+    ('Bronze', '#CD7F32')
+)
+
+
+@st.cache_data
+def supplier_matrix_figure(on_time: tuple, fill: tuple, orders: tuple, tier: tuple,
+                           name: tuple, score: tuple) -> go.Figure:
+    """On-time vs fill rate per supplier, sized by order count"""
+    suppliers = pd.DataFrame({
+        'on_time_rate': on_time,
+        'fill_rate': fill,
+        'total_orders': orders,
+        'tier': tier,
+        'supplier_name': name,
+        'reliability_score': score
+    })
+    fig = px.scatter(
+        suppliers,
+        x='on_time_rate',
+        y='fill_rate',
+        size='total_orders',
+        color='tier',
+        hover_data=['supplier_name', 'reliability_score'],
+        render_mode='webgl',
+        title="Supplier Performance Matrix",
+        color_discrete_map=dict(TIER_COLORS),
+        category_orders={'tier': [tier for tier, _ in TIER_COLORS]}
+    )
+    fig.add_hline(y=95, line_dash="dash", line_color="green", annotation_text="95% Fill Rate")
+    fig.add_vline(x=90, line_dash="dash", line_color="green", annotation_text="90% On-Time")
+    fig.update_layout(xaxis_title="On-Time Delivery %", yaxis_title="Fill Rate %")
+    return fig
+
+
+@st.cache_data
+def lead_time_cv_figure(name: tuple, cv_pct: tuple, category: tuple) -> go.Figure:
+    """Lead time coefficient of variation per supplier, in the order given"""
+    lead_times = pd.DataFrame({
+        'supplier_name': name,
+        'cv_pct': cv_pct,
+        'reliability_category': category
+    })
+    fig = px.bar(
+        lead_times,
+        x='supplier_name',
+        y='cv_pct',
+        color='reliability_category',
+        title="Lead Time Coefficient of Variation (Lower is Better)",
+        color_discrete_map={
+            'Highly Reliable': '#28a745',
+            'Reliable': '#17a2b8',
+            'Variable': '#ffc107',
+            'Unreliable': '#dc3545'
+        }
+    )
+    fig.update_layout(xaxis_title="Supplier", yaxis_title="CV %", xaxis_tickangle=-45)
+    return fig
 
 
-def render_supplier_performance(analytics: dict):
+def render_supplier_performance(data_dir: str):
     """Render supplier performance analysis"""
     st.subheader("🏭 Supplier Performance Analysis")
     
-    supplier_scores = analytics['supplier'].calculate_supplier_scores()
-    lead_time_data = analytics['supplier'].analyze_lead_time_variability()
+    supplier_scores = run_analysis(data_dir, 'supplier', 'calculate_supplier_scores')
+    lead_time_data = run_analysis(data_dir, 'supplier', 'analyze_lead_time_variability')
     
     col1, col2 = st.columns(2)
     
     with col1:
         # Tier distribution
-        tier_counts = supplier_scores['tier'].value_counts()
-        tier_order = ['Platinum', 'Gold', 'Silver', 'Bronze']
-        tier_counts = tier_counts.reindex(tier_order, fill_value=0)
+        # Categorical counts come back in tier order, including empty tiers
+        tier_counts = supplier_scores['tier'].value_counts(sort=False)
         
-        fig = px.bar(
-            x=tier_counts.index,
-            y=tier_counts.values,
-            color=tier_counts.index,
-            color_discrete_map={
-                'Platinum': '#C0C0C0',
-                'Gold': '#FFD700',
-                'Silver': '#A8A8A8',
-                'Bronze': '#CD7F32'
-            },
-            title="Suppliers by Performance Tier"
-        )
-        fig.update_layout(showlegend=False, xaxis_title="Tier", yaxis_title="Supplier Count")
+        fig = category_bar_figure(tuple(tier_counts.index), tuple(tier_counts.tolist()),
+                                  TIER_COLORS, "Suppliers by Performance Tier",
+                                  "Tier", "Supplier Count")
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # On-time vs Fill rate scatter
-        fig = px.scatter(
-            supplier_scores,
-            x='on_time_rate',
-            y='fill_rate',
-            size='total_orders',
-            color='tier',
-            hover_data=['supplier_name', 'reliability_score'],
-            title="Supplier Performance Matrix",
-            color_discrete_map={
-                'Platinum': '#C0C0C0',
-                'Gold': '#FFD700',
-                'Silver': '#A8A8A8',
-                'Bronze': '#CD7F32'
-            }
-        )
-        fig.add_hline(y=95, line_dash="dash", line_color="green", annotation_text="95% Fill Rate")
-        fig.add_vline(x=90, line_dash="dash", line_color="green", annotation_text="90% On-Time")
-        fig.update_layout(xaxis_title="On-Time Delivery %", yaxis_title="Fill Rate %")
+        fig = supplier_matrix_figure(*column_tuples(supplier_scores, [
+            'on_time_rate', 'fill_rate', 'total_orders', 'tier', 'supplier_name', 'reliability_score'
+        ]))
         st.plotly_chart(fig, use_container_width=True)
     
     # Top and bottom performers
+    top5, bottom5 = top_and_bottom(supplier_scores, 'reliability_score', 5)
     col1, col2 = st.columns(2)
     
     with col1:
         st.markdown("**🏆 Top 5 Suppliers**")
-        top5 = supplier_scores.nlargest(5, 'reliability_score')
         st.dataframe(top5[['supplier_name', 'on_time_rate', 'fill_rate', 'reliability_score', 'tier']], 
                      use_container_width=True, hide_index=True)
     
     with col2:
         st.markdown("**⚠️ Bottom 5 Suppliers**")
-        bottom5 = supplier_scores.nsmallest(5, 'reliability_score')
         st.dataframe(bottom5[['supplier_name', 'on_time_rate', 'fill_rate', 'reliability_score', 'tier']], 
                      use_container_width=True, hide_index=True)
     
     # Lead time variability
     st.markdown("**Lead Time Variability by Supplier**")
-    fig = px.bar(
-        lead_time_data.sort_values('cv_pct'),
-        x='supplier_name',
-        y='cv_pct',
-        color='reliability_category',
-        title="Lead Time Coefficient of Variation (Lower is Better)",
-        color_discrete_map={
-            'Highly Reliable': '#28a745',
-            'Reliable': '#17a2b8',
-            'Variable': '#ffc107',
-            'Unreliable': '#dc3545'
-        }
-    )
-    fig.update_layout(xaxis_title="Supplier", yaxis_title="CV %", xaxis_tickangle=-45)
+    fig = lead_time_cv_figure(*column_tuples(lead_time_data.sort_values('cv_pct'), [
+        'supplier_name', 'cv_pct', 'reliability_category'
+    ]))
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_stockout_analysis(analytics: dict, data: dict):
+@st.cache_data
+def root_cause_figures(cause: tuple, occurrences: tuple, lost_revenue: tuple):
+    """Stockout count donut and lost-revenue bars per root cause"""
+    causes = pd.DataFrame({
+        'root_cause': cause,
+        'occurrence_count': occurrences,
+        'total_lost_revenue': lost_revenue
+    })
+    pie = px.pie(
+        causes,
+        values='occurrence_count',
+        names='root_cause',
+        title="Stockout Root Causes",
+        hole=0.4
+    )
+    bar = px.bar(
+        causes.sort_values('total_lost_revenue', ascending=True),
+        x='total_lost_revenue',
+        y='root_cause',
+        orientation='h',
+        title="Lost Revenue by Root Cause",
+        color='total_lost_revenue',
+        color_continuous_scale='Reds'
+    )
+    bar.update_layout(xaxis_title="Lost Revenue ($)", yaxis_title="Root Cause", showlegend=False)
+    return pie, bar
+
+
+def render_stockout_analysis(data_dir: str, data: dict):
     """Render stockout analysis"""
     st.subheader("🚨 Stockout Analysis")
     
-    stockout_impact = analytics['stockout'].analyze_stockout_impact()
-    root_causes = analytics['stockout'].get_root_cause_analysis()
+    stockout_impact = run_analysis(data_dir, 'stockout', 'analyze_stockout_impact')
+    root_causes = run_analysis(data_dir, 'stockout', 'get_root_cause_analysis')
     
+    cause_fig, revenue_fig = root_cause_figures(*column_tuples(root_causes, [
+        'root_cause', 'occurrence_count', 'total_lost_revenue'
+    ]))
     col1, col2 = st.columns(2)
     
     with col1:
         # Root cause distribution
-        fig = px.pie(
-            root_causes,
-            values='occurrence_count',
-            names='root_cause',
-            title="Stockout Root Causes",
-            hole=0.4
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(cause_fig, use_container_width=True)
     
     with col2:
         # Lost revenue by root cause
-        fig = px.bar(
-            root_causes.sort_values('total_lost_revenue', ascending=True),
-            x='total_lost_revenue',
-            y='root_cause',
-            orientation='h',
-            title="Lost Revenue by Root Cause",
-            color='total_lost_revenue',
-            color_continuous_scale='Reds'
-        )
-        fig.update_layout(xaxis_title="Lost Revenue ($)", yaxis_title="Root Cause", showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(revenue_fig, use_container_width=True)
     
     # KPIs
     col1, col2, col3, col4 = st.columns(4)
     
     total_events = len(data['stockout_events'])
     total_lost = data['stockout_events']['lost_sales_amount'].sum()
-    avg_duration = (data['stockout_events']['stockout_end_date'] - 
-                   data['stockout_events']['stockout_start_date']).dt.days.mean()
+    avg_duration = data['stockout_events']['duration_days'].mean()
     products_affected = data['stockout_events']['product_id'].nunique()
     
     with col1:
@@ -407,22 +595,71 @@ def render_stockout_analysis(analytics: dict, data: dict):
     # Worst affected products
     st.markdown("**Most Impacted Products by Stockouts**")
     worst = stockout_impact.head(10)
-    worst['total_lost_revenue'] = worst['total_lost_revenue'].apply(lambda x: f"${x:,.2f}")
     st.dataframe(worst[['warehouse_code', 'sku', 'product_name', 'stockout_count', 
                         'avg_duration_days', 'total_lost_units', 'total_lost_revenue', 'severity_score']], 
-                 use_container_width=True, hide_index=True)
+                 use_container_width=True, hide_index=True,
+                 column_config={'total_lost_revenue': MONEY_COLUMN})
+
+
+ROP_COLORS = (
+    ('Increase ROP', '#dc3545'),
+    ('Decrease ROP', '#ffc107'),
+    ('Optimal', '#28a745')
+)
+
+
+@st.cache_data
+def rop_recommendation_figure(labels: tuple, counts: tuple) -> go.Figure:
+    """Share of products per reorder point recommendation"""
+    return px.pie(
+        values=list(counts),
+        names=list(labels),
+        title="ROP Recommendations",
+        color=list(labels),
+        color_discrete_map=dict(ROP_COLORS)
+    )
 
 
-def render_reorder_optimization(analytics: dict):
+@st.cache_data
+def rop_scatter_figure(current: tuple, calculated: tuple, recommendation: tuple,
+                       sku: tuple, name: tuple) -> go.Figure:
+    """Current vs calculated reorder points for a sample of products"""
+    sample = pd.DataFrame({
+        'current_rop': current,
+        'calculated_rop': calculated,
+        'recommendation': recommendation,
+        'sku': sku,
+        'product_name': name
+    })
+    fig = px.scatter(
+        sample,
+        x='current_rop',
+        y='calculated_rop',
+        color='recommendation',
+        hover_data=['sku', 'product_name'],
+        render_mode='webgl',
+        title="Current vs Calculated Reorder Points",
+        color_discrete_map=dict(ROP_COLORS)
+    )
+    # Add diagonal line
+    max_val = max(sample['current_rop'].max(), sample['calculated_rop'].max())
+    fig.add_trace(go.Scatter(x=[0, max_val], y=[0, max_val], mode='lines', 
+                             name='Perfect Alignment', line=dict(dash='dash', color='gray')))
+    fig.update_layout(xaxis_title="Current ROP", yaxis_title="Calculated ROP")
+    return fig
+
+
+def render_reorder_optimization(data_dir: str):
     """Render reorder point optimization"""
     st.subheader("📈 Reorder Point Optimization")
     
     service_level = st.slider("Target Service Level", 0.90, 0.99, 0.95, 0.01)
     
-    rop_data = analytics['inventory'].calculate_reorder_points(service_level=service_level)
+    rop_data = run_analysis(data_dir, 'inventory', 'calculate_reorder_points',
+                            service_level=service_level)
     
     # Summary by recommendation
-    rec_summary = rop_data['recommendation'].value_counts()
+    rec_summary = rop_data['recommendation'].value_counts(sort=False)
     
     col1, col2, col3 = st.columns(3)
     
@@ -440,40 +677,15 @@ def render_reorder_optimization(analytics: dict):
     col1, col2 = st.columns(2)
     
     with col1:
-        fig = px.pie(
-            values=rec_summary.values,
-            names=rec_summary.index,
-            title="ROP Recommendations",
-            color=rec_summary.index,
-            color_discrete_map={
-                'Increase ROP': '#dc3545',
-                'Decrease ROP': '#ffc107',
-                'Optimal': '#28a745'
-            }
-        )
+        fig = rop_recommendation_figure(tuple(rec_summary.index), tuple(rec_summary.tolist()))
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Current vs Calculated ROP scatter
-        sample = rop_data.sample(min(100, len(rop_data)))
-        fig = px.scatter(
-            sample,
-            x='current_rop',
-            y='calculated_rop',
-            color='recommendation',
-            hover_data=['sku', 'product_name'],
-            title="Current vs Calculated Reorder Points",
-            color_discrete_map={
-                'Increase ROP': '#dc3545',
-                'Decrease ROP': '#ffc107',
-                'Optimal': '#28a745'
-            }
-        )
-        # Add diagonal line
-        max_val = max(sample['current_rop'].max(), sample['calculated_rop'].max())
-        fig.add_trace(go.Scatter(x=[0, max_val], y=[0, max_val], mode='lines', 
-                                 name='Perfect Alignment', line=dict(dash='dash', color='gray')))
-        fig.update_layout(xaxis_title="Current ROP", yaxis_title="Calculated ROP")
+        plot_cols = ['current_rop', 'calculated_rop', 'recommendation', 'sku', 'product_name']
+        # A fixed sample keeps the figure's cache key stable across reruns
+        sample = rop_data[plot_cols].sample(min(100, len(rop_data)), random_state=0)
+        fig = rop_scatter_figure(*column_tuples(sample, plot_cols))
         st.plotly_chart(fig, use_container_width=True)
     
     # Products needing attention
@@ -485,7 +697,7 @@ def render_reorder_optimization(analytics: dict):
         st.dataframe(needs_increase[display_cols].head(10), use_container_width=True, hide_index=True)
 
 
-def render_eoq_analysis(analytics: dict):
+def render_eoq_analysis(data_dir: str):
     """Render EOQ analysis"""
     st.subheader("📦 Economic Order Quantity Analysis")
     
@@ -496,7 +708,8 @@ def render_eoq_analysis(analytics: dict):
     with col2:
         holding_rate = st.slider("Annual Holding Cost Rate (%)", 15, 40, 25) / 100
     
-    eoq_data = analytics['inventory'].calculate_eoq(
+    eoq_data = run_analysis(
+        data_dir, 'inventory', 'calculate_eoq',
         ordering_cost=ordering_cost,
         holding_cost_rate=holding_rate
     )
@@ -505,25 +718,17 @@ def render_eoq_analysis(analytics: dict):
     
     with col1:
         # EOQ distribution
-        fig = px.histogram(
-            eoq_data,
-            x='eoq',
-            nbins=50,
-            title="Distribution of Economic Order Quantities",
-            color_discrete_sequence=['#2E86AB']
-        )
+        fig = binned_histogram(eoq_data['eoq'].to_numpy(), bins=50,
+                               title="Distribution of Economic Order Quantities",
+                               color='#2E86AB')
         fig.update_layout(xaxis_title="EOQ (units)", yaxis_title="Product Count")
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Orders per year distribution
-        fig = px.histogram(
-            eoq_data,
-            x='orders_per_year',
-            nbins=30,
-            title="Distribution of Orders per Year",
-            color_discrete_sequence=['#A23B72']
-        )
+        fig = binned_histogram(eoq_data['orders_per_year'].to_numpy(), bins=30,
+                               title="Distribution of Orders per Year",
+                               color='#A23B72')
         fig.update_layout(xaxis_title="Orders per Year", yaxis_title="Product Count")
         st.plotly_chart(fig, use_container_width=True)
     
@@ -543,65 +748,46 @@ def render_eoq_analysis(analytics: dict):
     # Top products by EOQ
     st.markdown("**Products with Highest EOQ Values**")
     top_eoq = eoq_data.nlargest(10, 'eoq')
-    top_eoq['annual_inventory_cost'] = top_eoq['annual_inventory_cost'].apply(lambda x: f"${x:,.2f}")
     st.dataframe(top_eoq[['sku', 'product_name', 'annual_demand', 'eoq', 
                           'orders_per_year', 'days_between_orders', 'annual_inventory_cost']], 
-                 use_container_width=True, hide_index=True)
+                 use_container_width=True, hide_index=True,
+                 column_config={'annual_inventory_cost': MONEY_COLUMN})
 
 
-def render_carrying_costs(analytics: dict):
-    """Render carrying costs analysis"""
-    st.subheader("💰 Inventory Carrying Costs")
-    
-    carrying_data = analytics['inventory'].calculate_carrying_costs()
-    
-    # Summary by warehouse
-    warehouse_summary = carrying_data.groupby(['warehouse_code', 'warehouse_name']).agg({
-        'product_count': 'sum',
-        'total_units': 'sum',
-        'inventory_value': 'sum',
-        'total_carrying_cost': 'sum'
-    }).reset_index()
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        fig = px.bar(
-            warehouse_summary,
-            x='warehouse_code',
-            y='total_carrying_cost',
-            title="Annual Carrying Cost by Warehouse",
-            color='warehouse_code',
-            text=warehouse_summary['total_carrying_cost'].apply(lambda x: f"${x/1000:.0f}K")
-        )
-        fig.update_traces(textposition='outside')
-        fig.update_layout(showlegend=False, xaxis_title="Warehouse", yaxis_title="Carrying Cost ($)")
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        fig = px.pie(
-            warehouse_summary,
-            values='inventory_value',
-            names='warehouse_code',
-            title="Inventory Value Distribution by Warehouse"
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Cost breakdown
-    st.markdown("**Cost Component Breakdown**")
-    
-    total_costs = carrying_data.agg({
-        'capital_cost': 'sum',
-        'storage_cost': 'sum',
-        'insurance_cost': 'sum',
-        'obsolescence_cost': 'sum',
-        'handling_cost': 'sum'
+@st.cache_data
+def warehouse_carrying_figures(code: tuple, carrying_cost: tuple, inventory_value: tuple):
+    """Annual carrying cost bars and inventory value pie per warehouse"""
+    warehouse_summary = pd.DataFrame({
+        'warehouse_code': code,
+        'total_carrying_cost': carrying_cost,
+        'inventory_value': inventory_value
     })
-    
+    bar = px.bar(
+        warehouse_summary,
+        x='warehouse_code',
+        y='total_carrying_cost',
+        title="Annual Carrying Cost by Warehouse",
+        color='warehouse_code',
+        text=warehouse_summary['total_carrying_cost'].apply(lambda x: f"${x/1000:.0f}K")
+    )
+    bar.update_traces(textposition='outside')
+    bar.update_layout(showlegend=False, xaxis_title="Warehouse", yaxis_title="Carrying Cost ($)")
+    pie = px.pie(
+        warehouse_summary,
+        values='inventory_value',
+        names='warehouse_code',
+        title="Inventory Value Distribution by Warehouse"
+    )
+    return bar, pie
+
+
+@st.cache_data
+def cost_component_figure(amounts: tuple) -> go.Figure:
+    """Carrying cost totals per component (capital, storage, insurance, obsolescence, handling)"""
     cost_breakdown = pd.DataFrame({
         'Component': ['Capital Cost (8%)', 'Storage (5%)', 'Insurance (3%)', 
                      'Obsolescence (2%)', 'Handling (2%)'],
-        'Amount': total_costs.values
+        'Amount': amounts
     })
     
     fig = px.bar(
@@ -609,17 +795,52 @@ def render_carrying_costs(analytics: dict):
         x='Component',
         y='Amount',
         title="Carrying Cost Components",
-        color='Component',
-        text=cost_breakdown['Amount'].apply(lambda x: f"${x:,.0f}")
+        color='Component'
     )
-    fig.update_traces(textposition='outside')
+    fig.update_traces(texttemplate='$%{y:,.0f}', textposition='outside')
     fig.update_layout(showlegend=False)
+    return fig
+
+
+def render_carrying_costs(data_dir: str):
+    """Render carrying costs analysis"""
+    st.subheader("💰 Inventory Carrying Costs")
+    
+    carrying_data = run_analysis(data_dir, 'inventory', 'calculate_carrying_costs')
+    
+    # Summary by warehouse; the cost components are summed in the same pass
+    # (warehouse_name is determined by warehouse_code and is not charted)
+    cost_cols = ['capital_cost', 'storage_cost', 'insurance_cost',
+                 'obsolescence_cost', 'handling_cost']
+    by_warehouse = carrying_data.groupby('warehouse_code', observed=True)[
+        ['product_count', 'total_units', 'inventory_value', 'total_carrying_cost',
+         'monthly_carrying_cost'] + cost_cols
+    ].sum()
+    warehouse_summary = by_warehouse.reset_index()
+    
+    cost_fig, value_fig = warehouse_carrying_figures(*column_tuples(warehouse_summary, [
+        'warehouse_code', 'total_carrying_cost', 'inventory_value'
+    ]))
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(cost_fig, use_container_width=True)
+    
+    with col2:
+        st.plotly_chart(value_fig, use_container_width=True)
+    
+    # Cost breakdown
+    st.markdown("**Cost Component Breakdown**")
+    
+    total_costs = by_warehouse[cost_cols].sum()
+    
+    fig = cost_component_figure(tuple(total_costs.tolist()))
     st.plotly_chart(fig, use_container_width=True)
     
     # Summary metrics
-    total_value = carrying_data['inventory_value'].sum()
-    total_carrying = carrying_data['total_carrying_cost'].sum()
-    monthly_carrying = carrying_data['monthly_carrying_cost'].sum()
+    total_value = by_warehouse['inventory_value'].sum()
+    total_carrying = by_warehouse['total_carrying_cost'].sum()
+    monthly_carrying = by_warehouse['monthly_carrying_cost'].sum()
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -630,6 +851,23 @@ def render_carrying_costs(analytics: dict):
         st.metric("Monthly Carrying Cost", f"${monthly_carrying:,.0f}")
 
 
+@st.cache_data
+def sales_trend_figure(month: tuple, total_amount: tuple) -> go.Figure:
+    """Monthly sales revenue as a line with markers"""
+    fig = px.line(x=list(month), y=list(total_amount), title="Monthly Sales Trend", markers=True)
+    fig.update_layout(xaxis_title="Month", yaxis_title="Revenue ($)", xaxis_tickformat="%Y-%m")
+    return fig
+
+
+@st.cache_data
+def warehouse_value_figure(code: tuple, value: tuple) -> go.Figure:
+    """Inventory value per warehouse as colored bars"""
+    fig = px.bar(x=list(code), y=list(value), title="Inventory Value by Warehouse",
+                 color=list(code))
+    fig.update_layout(showlegend=False, xaxis_title="Warehouse", yaxis_title="Value ($)")
+    return fig
+
+
 def main():
     """Main dashboard application"""
     
@@ -662,60 +900,59 @@ def main():
         return
     
     data = load_data(data_dir)
-    analytics = get_analytics(data_dir)
     
     # Render selected page
     if page == "📊 Executive Summary":
-        render_kpis(data)
+        render_kpis(data_dir, data)
         st.markdown("---")
         
         col1, col2 = st.columns(2)
         with col1:
             # Sales trend
-            sales = data['sales_orders'].copy()
-            sales['month'] = sales['order_date'].dt.to_period('M').astype(str)
-            monthly_sales = sales.groupby('month')['total_amount'].sum().reset_index()
-            
-            fig = px.line(monthly_sales, x='month', y='total_amount', 
-                         title="Monthly Sales Trend", markers=True)
-            fig.update_layout(xaxis_title="Month", yaxis_title="Revenue ($)")
+            fig = sales_trend_figure(*column_tuples(monthly_sales(data_dir), ['month', 'total_amount']))
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Inventory by warehouse
-            inv = data['inventory'].merge(data['products'][['product_id', 'unit_cost']], on='product_id')
-            inv['value'] = inv['quantity_on_hand'] * inv['unit_cost']
-            warehouse_inv = inv.groupby('warehouse_id')['value'].sum().reset_index()
-            warehouse_inv = warehouse_inv.merge(data['warehouses'][['warehouse_id', 'warehouse_code']], on='warehouse_id')
-            
-            fig = px.bar(warehouse_inv, x='warehouse_code', y='value',
-                        title="Inventory Value by Warehouse", color='warehouse_code')
-            fig.update_layout(showlegend=False, xaxis_title="Warehouse", yaxis_title="Value ($)")
+            warehouses = data['warehouses'].sort_values('warehouse_id')
+            positions = pd.Index(warehouses['warehouse_id']).get_indexer(
+                data['inventory']['warehouse_id']
+            )
+            values = inventory_values(data_dir)
+            # Rows whose warehouse is unknown (-1) are left out, as an inner join would
+            known = positions >= 0
+            positions, values = positions[known], values[known]
+            stocked = np.bincount(positions, minlength=len(warehouses)) > 0
+            fig = warehouse_value_figure(
+                tuple(warehouses['warehouse_code'].to_numpy()[stocked].tolist()),
+                tuple(np.bincount(positions, weights=np.nan_to_num(values),
+                                  minlength=len(warehouses))[stocked].tolist())
+            )
             st.plotly_chart(fig, use_container_width=True)
         
         st.markdown("---")
         st.info("Use the sidebar to navigate to detailed analysis sections.")
         
     elif page == "🏷️ ABC Classification":
-        render_abc_analysis(analytics)
+        render_abc_analysis(data_dir)
         
     elif page == "🔄 Inventory Turnover":
-        render_inventory_turnover(analytics)
+        render_inventory_turnover(data_dir)
         
     elif page == "🏭 Supplier Performance":
-        render_supplier_performance(analytics)
+        render_supplier_performance(data_dir)
         
     elif page == "🚨 Stockout Analysis":
-        render_stockout_analysis(analytics, data)
+        render_stockout_analysis(data_dir, data)
         
     elif page == "📈 Reorder Optimization":
-        render_reorder_optimization(analytics)
+        render_reorder_optimization(data_dir)
         
     elif page == "📦 EOQ Analysis":
-        render_eoq_analysis(analytics)
+        render_eoq_analysis(data_dir)
         
     elif page == "💰 Carrying Costs":
-        render_carrying_costs(analytics)
+        render_carrying_costs(data_dir)
     
     # Footer
     st.sidebar.markdown("---")
@@ -6,13 +6,27 @@ Description: Generates realistic synthetic data for supply chain analytics proje
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
-import random
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Write buffer for each CSV file (8 MiB)
+CSV_WRITE_BUFFER = 8 << 20
+
+
+def _format_codes(prefix, numbers, width: int) -> np.ndarray:
+    """Build zero-padded codes such as SKU-00042 for a whole column at once"""
+    return np.char.add(prefix, np.char.zfill(np.asarray(numbers).astype(str), width))
+
+
+def _downcast_integers(df: pd.DataFrame) -> pd.DataFrame:
+    """Store each integer column in the narrowest integer type that holds its values"""
+    for col in df.select_dtypes("integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
 
 class SupplyChainDataGenerator:
     """Generates synthetic supply chain data with realistic patterns"""
@@ -21,6 +35,9 @@ class SupplyChainDataGenerator:
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
         
+        # All random draws come from one seeded Generator, batched per column where possible
+        self.rng = np.random.default_rng(42)
+        
         # Configuration
         self.n_warehouses = 5
         self.n_products = 200
@@ -45,8 +62,8 @@ class SupplyChainDataGenerator:
         self.demand_forecasts = None
         self.stockout_events = None
     
-    def generate_all(self):
-        """Generate all synthetic data"""
+    def generate_all(self, formats: tuple = ("csv", "parquet")):
+        """Generate all synthetic data and save it in the given file formats"""
         print("Generating supply chain data...")
         
         self._generate_warehouses()
@@ -58,11 +75,20 @@ class SupplyChainDataGenerator:
         self._generate_purchase_orders()
         self._generate_sales_orders()
         self._generate_inventory()
-        self._generate_inventory_transactions()
-        self._generate_demand_forecasts()
-        self._generate_stockout_events()
         
-        self._save_all()
+        # The remaining tables only read what has been generated above, so they are built
+        # concurrently; forecasts draw from their own child stream to stay reproducible
+        forecast_rng, = self.rng.spawn(1)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(self._generate_inventory_transactions),
+                pool.submit(self._generate_demand_forecasts, forecast_rng),
+                pool.submit(self._generate_stockout_events),
+            ]
+            for future in futures:
+                future.result()
+        
+        self._save_all(formats)
         print(f"Data generation complete! Files saved to {self.output_dir}/")
         
         return self
@@ -81,8 +107,8 @@ class SupplyChainDataGenerator:
             "warehouse_code", "warehouse_name", "city", "state", "latitude", "longitude"
         ])
         self.warehouses["warehouse_id"] = range(1, len(self.warehouses) + 1)
-        self.warehouses["capacity_units"] = np.random.randint(50000, 150000, len(self.warehouses))
-        self.warehouses["operating_cost_per_unit"] = np.round(np.random.uniform(2.5, 5.0, len(self.warehouses)), 2)
+        self.warehouses["capacity_units"] = self.rng.integers(50000, 150000, len(self.warehouses))
+        self.warehouses["operating_cost_per_unit"] = np.round(self.rng.uniform(2.5, 5.0, len(self.warehouses)), 2)
         self.warehouses["is_active"] = True
         
         print(f"  Generated {len(self.warehouses)} warehouses")
@@ -115,7 +141,8 @@ class SupplyChainDataGenerator:
     
     def _generate_products(self):
         """Generate product catalog with ABC distribution"""
-        products_list = []
+        rng = self.rng
+        n = self.n_products
         
         # Product name components
         prefixes = ["Premium", "Standard", "Economy", "Professional", "Ultra", "Basic", "Advanced"]
@@ -127,45 +154,49 @@ class SupplyChainDataGenerator:
             "Paper Ream", "Notebook", "Pen Set", "Stapler", "Folder", "Binder",
             "Shampoo", "Lotion", "Vitamins", "First Aid Kit", "Thermometer"
         ]
+        variants = ["A", "B", "C", "Pro", "Plus", "Lite", "Max", ""]
         
         # Leaf categories for assignment
-        leaf_categories = [6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
+        leaf_categories = np.array([6, 7, 8, 9, 10, 11, 12, 13, 14, 15])
         
-        for i in range(1, self.n_products + 1):
-            prefix = random.choice(prefixes)
-            item = random.choice(items)
-            variant = random.choice(["A", "B", "C", "Pro", "Plus", "Lite", "Max", ""])
-            
-            # ABC distribution: 20% high-value, 30% medium, 50% low
-            abc_rand = random.random()
-            if abc_rand < 0.20:  # A-class items (high value, high demand)
-                unit_cost = round(random.uniform(100, 500), 2)
-                base_demand = random.randint(50, 200)
-            elif abc_rand < 0.50:  # B-class items
-                unit_cost = round(random.uniform(30, 100), 2)
-                base_demand = random.randint(20, 80)
-            else:  # C-class items
-                unit_cost = round(random.uniform(5, 30), 2)
-                base_demand = random.randint(5, 30)
-            
-            products_list.append({
-                "product_id": i,
-                "sku": f"SKU-{i:05d}",
-                "product_name": f"{prefix} {item} {variant}".strip(),
-                "category_id": random.choice(leaf_categories),
-                "unit_cost": unit_cost,
-                "unit_price": round(unit_cost * random.uniform(1.3, 2.0), 2),
-                "weight_kg": round(random.uniform(0.1, 25), 3),
-                "volume_cubic_m": round(random.uniform(0.001, 0.5), 4),
-                "lead_time_days": random.randint(3, 21),
-                "safety_stock_days": random.randint(2, 7),
-                "min_order_quantity": random.choice([1, 5, 10, 25, 50]),
-                "is_perishable": random.random() < 0.1,
-                "is_active": True,
-                "base_daily_demand": base_demand  # For simulation
-            })
-        
-        self.products = pd.DataFrame(products_list)
+        product_ids = np.arange(1, n + 1)
+        product_names = [
+            f"{prefix} {item} {variant}".strip()
+            for prefix, item, variant in zip(rng.choice(prefixes, n), rng.choice(items, n),
+                                             rng.choice(variants, n))
+        ]
+        
+        # ABC distribution: 20% high-value (A), 30% medium (B), 50% low (C);
+        # cost and demand ranges are looked up per class
+        abc_rand = rng.random(n)
+        abc_class = np.select([abc_rand < 0.20, abc_rand < 0.50], [0, 1], default=2)
+        cost_low, cost_high = np.array([100, 30, 5])[abc_class], np.array([500, 100, 30])[abc_class]
+        demand_low, demand_high = np.array([50, 20, 5])[abc_class], np.array([200, 80, 30])[abc_class]
+        
+        unit_cost = np.round(rng.uniform(cost_low, cost_high), 2)
+        
+        self.products = pd.DataFrame({
+            "product_id": product_ids,
+            "sku": _format_codes("SKU-", product_ids, 5),
+            "product_name": product_names,
+            "category_id": rng.choice(leaf_categories, n),
+            "unit_cost": unit_cost,
+            "unit_price": np.round(unit_cost * rng.uniform(1.3, 2.0, n), 2),
+            "weight_kg": np.round(rng.uniform(0.1, 25, n), 3),
+            "volume_cubic_m": np.round(rng.uniform(0.001, 0.5, n), 4),
+            "lead_time_days": rng.integers(3, 21, n, endpoint=True),
+            "safety_stock_days": rng.integers(2, 7, n, endpoint=True),
+            "min_order_quantity": rng.choice([1, 5, 10, 25, 50], n),
+            "is_perishable": rng.random(n) < 0.1,
+            "is_active": True,
+            "base_daily_demand": rng.integers(demand_low, demand_high, endpoint=True)  # For simulation
+        })
+        
+        # Attribute arrays indexed by product_id - 1, for O(1) lookups inside the order loops
+        self._product_unit_cost = self.products["unit_cost"].to_numpy()
+        self._product_unit_price = self.products["unit_price"].to_numpy()
+        self._product_min_order_qty = self.products["min_order_quantity"].to_numpy()
+        self._product_base_demand = self.products["base_daily_demand"].to_numpy()
         print(f"  Generated {len(self.products)} products")
     
     def _generate_suppliers(self):
@@ -180,62 +211,78 @@ class SupplyChainDataGenerator:
             "StarLogistics"
         ]
         
-        suppliers_list = []
-        for i, name in enumerate(company_names[:self.n_suppliers], 1):
-            # Simulate supplier reliability - some are very reliable, some less so
-            reliability = random.random()
-            
-            suppliers_list.append({
-                "supplier_id": i,
-                "supplier_code": f"SUP-{i:03d}",
-                "supplier_name": name,
-                "contact_name": f"Contact {i}",
-                "email": f"contact@{name.lower().replace(' ', '')}.com",
-                "phone": f"555-{random.randint(100,999)}-{random.randint(1000,9999)}",
-                "city": random.choice(["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"]),
-                "state": random.choice(["NY", "CA", "IL", "TX", "AZ"]),
-                "country": "USA",
-                "payment_terms_days": random.choice([15, 30, 45, 60]),
-                "is_preferred": reliability > 0.7,
-                "quality_rating": round(3.0 + reliability * 2, 2),  # 3.0 - 5.0 range
-                "is_active": True,
-                "reliability_factor": reliability  # Internal use for simulation
-            })
-        
-        self.suppliers = pd.DataFrame(suppliers_list)
+        rng = self.rng
+        names = company_names[:self.n_suppliers]
+        n = len(names)
+        supplier_ids = np.arange(1, n + 1)
+        
+        # Simulate supplier reliability - some are very reliable, some less so
+        reliability = rng.random(n)
+        
+        self.suppliers = pd.DataFrame({
+            "supplier_id": supplier_ids,
+            "supplier_code": _format_codes("SUP-", supplier_ids, 3),
+            "supplier_name": names,
+            "contact_name": [f"Contact {i}" for i in supplier_ids],
+            "email": [f"contact@{name.lower().replace(' ', '')}.com" for name in names],
+            "phone": self._phone_numbers(n),
+            "city": rng.choice(["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"], n),
+            "state": rng.choice(["NY", "CA", "IL", "TX", "AZ"], n),
+            "country": "USA",
+            "payment_terms_days": rng.choice([15, 30, 45, 60], n),
+            "is_preferred": reliability > 0.7,
+            "quality_rating": np.round(3.0 + reliability * 2, 2),  # 3.0 - 5.0 range
+            "is_active": True,
+            "reliability_factor": reliability  # Internal use for simulation
+        })
+        
+        # Attribute arrays indexed by supplier_id - 1
+        self._supplier_codes = self.suppliers["supplier_code"].to_numpy()
+        self._supplier_reliability = self.suppliers["reliability_factor"].to_numpy()
         print(f"  Generated {len(self.suppliers)} suppliers")
     
     def _generate_product_suppliers(self):
         """Generate product-supplier mappings"""
-        ps_list = []
-        ps_id = 1
-        
-        for _, product in self.products.iterrows():
-            # Each product has 1-3 suppliers
-            n_suppliers = random.randint(1, 3)
-            supplier_ids = random.sample(range(1, self.n_suppliers + 1), n_suppliers)
-            
-            for idx, sup_id in enumerate(supplier_ids):
-                supplier = self.suppliers[self.suppliers.supplier_id == sup_id].iloc[0]
-                
-                # Primary supplier usually has better terms
-                is_primary = idx == 0
-                lead_time_variation = -2 if is_primary else random.randint(0, 5)
-                cost_variation = 1.0 if is_primary else random.uniform(1.0, 1.15)
-                
-                ps_list.append({
-                    "product_supplier_id": ps_id,
-                    "product_id": product.product_id,
-                    "supplier_id": sup_id,
-                    "supplier_sku": f"{supplier.supplier_code}-{product.sku}",
-                    "unit_cost": round(product.unit_cost * cost_variation, 2),
-                    "min_order_quantity": product.min_order_quantity,
-                    "lead_time_days": max(1, product.lead_time_days + lead_time_variation),
-                    "is_primary_supplier": is_primary
-                })
-                ps_id += 1
-        
-        self.product_suppliers = pd.DataFrame(ps_list)
+        rng = self.rng
+        n_products = len(self.products)
+        
+        # Each product has 1-3 distinct suppliers (a random ranking of all suppliers, cut
+        # to length); the first one is its primary supplier
+        max_suppliers = min(3, self.n_suppliers)
+        n_suppliers = rng.integers(1, max_suppliers, n_products, endpoint=True)
+        ranked = rng.random((n_products, self.n_suppliers)).argsort(axis=1)[:, :max_suppliers] + 1
+        rank = np.broadcast_to(np.arange(max_suppliers), ranked.shape)
+        keep = rank < n_suppliers[:, None]
+        
+        supplier_ids = ranked[keep]
+        is_primary = rank[keep] == 0
+        products = self.products.iloc[np.repeat(np.arange(n_products), n_suppliers)]
+        n_rows = len(supplier_ids)
+        
+        # Primary supplier usually has better terms
+        lead_time_variation = np.where(is_primary, -2, rng.integers(0, 5, n_rows, endpoint=True))
+        cost_variation = np.where(is_primary, 1.0, rng.uniform(1.0, 1.15, n_rows))
+        
+        self.product_suppliers = pd.DataFrame({
+            "product_supplier_id": np.arange(1, n_rows + 1),
+            "product_id": products["product_id"].to_numpy(),
+            "supplier_id": supplier_ids,
+            "supplier_sku": np.char.add(
+                np.char.add(self._supplier_codes[supplier_ids - 1].astype(str), "-"),
+                products["sku"].to_numpy().astype(str)
+            ),
+            "unit_cost": np.round(products["unit_cost"].to_numpy() * cost_variation, 2),
+            "min_order_quantity": products["min_order_quantity"].to_numpy(),
+            "lead_time_days": np.maximum(1, products["lead_time_days"].to_numpy() + lead_time_variation),
+            "is_primary_supplier": is_primary
+        })
+        
+        # Mapping rows offered by each supplier, and mapping attributes indexed by row
+        self._supplier_mapping_rows = self.product_suppliers.groupby("supplier_id").indices
+        self._mapping_product_id = self.product_suppliers["product_id"].to_numpy()
+        self._mapping_unit_cost = self.product_suppliers["unit_cost"].to_numpy()
+        self._mapping_min_order_qty = self.product_suppliers["min_order_quantity"].to_numpy()
+        self._mapping_lead_time = self.product_suppliers["lead_time_days"].to_numpy()
         print(f"  Generated {len(self.product_suppliers)} product-supplier mappings")
     
     def _generate_customers(self):
@@ -259,405 +306,396 @@ class SupplyChainDataGenerator:
             ("Charlotte", "NC", 35.2271, -80.8431),
         ]
         
-        customers_list = []
-        for i in range(1, self.n_customers + 1):
-            city_info = random.choice(cities)
-            cust_type = random.choice(customer_types)
-            
-            # Larger customers (wholesale/distributor) have higher credit limits
-            if cust_type in ["Wholesale", "Distributor"]:
-                credit_limit = round(random.uniform(100000, 500000), 2)
-            else:
-                credit_limit = round(random.uniform(10000, 100000), 2)
-            
-            customers_list.append({
-                "customer_id": i,
-                "customer_code": f"CUST-{i:04d}",
-                "customer_name": f"Customer {i} {cust_type}",
-                "customer_type": cust_type,
-                "email": f"orders@customer{i}.com",
-                "phone": f"555-{random.randint(100,999)}-{random.randint(1000,9999)}",
-                "city": city_info[0],
-                "state": city_info[1],
-                "zip_code": f"{random.randint(10000, 99999)}",
-                "country": "USA",
-                "latitude": city_info[2] + random.uniform(-0.5, 0.5),
-                "longitude": city_info[3] + random.uniform(-0.5, 0.5),
-                "credit_limit": credit_limit,
-                "is_active": True
-            })
-        
-        self.customers = pd.DataFrame(customers_list)
+        rng = self.rng
+        n = self.n_customers
+        customer_ids = np.arange(1, n + 1)
+        city_names, states, latitudes, longitudes = (np.array(col) for col in zip(*cities))
+        city_rows = rng.integers(0, len(cities), n)
+        cust_type = rng.choice(customer_types, n)
+        
+        # Larger customers (wholesale/distributor) have higher credit limits
+        is_large = np.isin(cust_type, ["Wholesale", "Distributor"])
+        credit_limit = np.round(
+            np.where(is_large, rng.uniform(100000, 500000, n), rng.uniform(10000, 100000, n)), 2
+        )
+        
+        self.customers = pd.DataFrame({
+            "customer_id": customer_ids,
+            "customer_code": _format_codes("CUST-", customer_ids, 4),
+            "customer_name": [f"Customer {i} {t}" for i, t in zip(customer_ids, cust_type)],
+            "customer_type": cust_type,
+            "email": [f"orders@customer{i}.com" for i in customer_ids],
+            "phone": self._phone_numbers(n),
+            "city": city_names[city_rows],
+            "state": states[city_rows],
+            "zip_code": rng.integers(10000, 99999, n, endpoint=True).astype(str),
+            "country": "USA",
+            "latitude": latitudes[city_rows] + rng.uniform(-0.5, 0.5, n),
+            "longitude": longitudes[city_rows] + rng.uniform(-0.5, 0.5, n),
+            "credit_limit": credit_limit,
+            "is_active": True
+        })
         print(f"  Generated {len(self.customers)} customers")
     
     def _generate_purchase_orders(self):
         """Generate purchase order history"""
-        po_list = []
-        poi_list = []
-        po_id = 1
-        poi_id = 1
-        
-        current_date = self.date_start
-        
-        while current_date <= self.date_end:
-            # Generate 5-15 POs per day
-            n_pos = random.randint(5, 15)
+        # Generate 5-15 POs per day. The schedule is fixed up front: one flat sequence of
+        # orders with their dates and random draws (and those of their lines). Dates are
+        # day numbers counted from date_start until the frame is built
+        rng = self.rng
+        n_days = (self.date_end - self.date_start).days + 1
+        pos_per_day = rng.integers(5, 15, n_days, endpoint=True)
+        order_days = np.repeat(np.arange(n_days), pos_per_day)
+        n_pos = len(order_days)
+        supplier_ids = self.suppliers["supplier_id"].to_numpy()[rng.integers(0, len(self.suppliers), n_pos)]
+        warehouse_ids = self.warehouses["warehouse_id"].to_numpy()[rng.integers(0, len(self.warehouses), n_pos)]
+        item_counts = rng.integers(1, 5, n_pos, endpoint=True)
+        variance_draws = rng.random(n_pos)
+        open_statuses = rng.choice(["Submitted", "Confirmed", "Shipped"], n_pos)
+        n_lines = item_counts.sum()
+        qty_draws = rng.integers(50, 500, n_lines, endpoint=True)
+        received_draws = rng.uniform(0.95, 1.0, n_lines)
+        
+        # The loop only picks each PO's products; line columns are preallocated for the
+        # most lines the orders can have and filled through a write cursor, one block of
+        # slots per PO. Everything else is computed per column afterwards
+        kept = np.empty(n_pos, dtype=bool)
+        lead_days = np.zeros(n_pos, dtype=np.int64)
+        poi_order = np.empty(n_lines, dtype=np.int64)
+        poi_mapping = np.empty(n_lines, dtype=np.int64)
+        line = 0
+        
+        for k in range(n_pos):
+            # Get products this supplier can provide
+            supplier_rows = self._supplier_mapping_rows.get(supplier_ids[k])
+            kept[k] = supplier_rows is not None
             
-            for _ in range(n_pos):
-                supplier = self.suppliers.sample(1).iloc[0]
-                warehouse = self.warehouses.sample(1).iloc[0]
-                
-                # Get products this supplier can provide
-                supplier_products = self.product_suppliers[
-                    self.product_suppliers.supplier_id == supplier.supplier_id
-                ]
-                
-                if len(supplier_products) == 0:
-                    continue
-                
-                # Order 1-5 different products
-                n_items = min(random.randint(1, 5), len(supplier_products))
-                items = supplier_products.sample(n_items)
-                
-                # Calculate delivery dates based on supplier reliability
-                base_lead_time = items.lead_time_days.mean()
-                expected_delivery = current_date + timedelta(days=int(base_lead_time))
-                
-                # Actual delivery varies by supplier reliability
-                reliability = supplier.reliability_factor
-                delivery_variance = int((1 - reliability) * 7)  # Less reliable = more variance
-                actual_variance = random.randint(-2, delivery_variance)
-                actual_delivery = expected_delivery + timedelta(days=actual_variance)
-                
-                # Determine status based on dates
-                if actual_delivery > self.date_end:
-                    status = random.choice(["Submitted", "Confirmed", "Shipped"])
-                    actual_delivery = None
-                else:
-                    status = "Delivered"
-                
-                # Create PO
-                total_amount = 0
-                po_items = []
-                
-                for _, item in items.iterrows():
-                    product = self.products[self.products.product_id == item.product_id].iloc[0]
-                    qty = random.randint(50, 500) * product.min_order_quantity
-                    qty = max(qty, item.min_order_quantity)
-                    
-                    line_total = qty * item.unit_cost
-                    total_amount += line_total
-                    
-                    # Quantity received may be less due to quality issues
-                    if status == "Delivered":
-                        qty_received = int(qty * random.uniform(0.95, 1.0))
-                    else:
-                        qty_received = 0
-                    
-                    po_items.append({
-                        "po_item_id": poi_id,
-                        "po_id": po_id,
-                        "product_id": item.product_id,
-                        "quantity_ordered": qty,
-                        "quantity_received": qty_received,
-                        "unit_cost": item.unit_cost
-                    })
-                    poi_id += 1
-                
-                po_list.append({
-                    "po_id": po_id,
-                    "po_number": f"PO-{current_date.year}-{po_id:06d}",
-                    "supplier_id": supplier.supplier_id,
-                    "warehouse_id": warehouse.warehouse_id,
-                    "order_date": current_date,
-                    "expected_delivery_date": expected_delivery,
-                    "actual_delivery_date": actual_delivery,
-                    "status": status,
-                    "total_amount": round(total_amount, 2)
-                })
-                
-                poi_list.extend(po_items)
-                po_id += 1
+            if supplier_rows is None:
+                continue
             
-            current_date += timedelta(days=1)
-        
-        self.purchase_orders = pd.DataFrame(po_list)
-        self.purchase_order_items = pd.DataFrame(poi_list)
+            # Order 1-5 different products
+            n_items = min(item_counts[k], len(supplier_rows))
+            items = supplier_rows[rng.choice(len(supplier_rows), n_items, replace=False)]
+            
+            # Delivery is expected after the mean lead time of the ordered products
+            lead_days[k] = int(self._mapping_lead_time[items].mean())
+            
+            poi_order[line:line + n_items] = k
+            poi_mapping[line:line + n_items] = items
+            line += n_items
+        
+        poi_order, poi_mapping = poi_order[:line], poi_mapping[:line]
+        
+        # Actual delivery varies by supplier reliability; the variance is uniform
+        # over [-2, delivery_variance] days
+        expected_delivery = order_days + lead_days
+        reliability = self._supplier_reliability[supplier_ids - 1]
+        delivery_variance = ((1 - reliability) * 7).astype(np.int64)  # Less reliable = more variance
+        actual_delivery = expected_delivery - 2 + (variance_draws * (delivery_variance + 3)).astype(np.int64)
+        
+        # Determine status based on dates
+        delivered = actual_delivery < n_days
+        status = np.where(delivered, "Delivered", open_statuses)
+        
+        # Line quantities; quantity received may be less due to quality issues
+        product_ids = self._mapping_product_id[poi_mapping]
+        unit_costs = self._mapping_unit_cost[poi_mapping]
+        qty = np.maximum(
+            qty_draws[:line] * self._product_min_order_qty[product_ids - 1],
+            self._mapping_min_order_qty[poi_mapping]
+        )
+        qty_received = np.where(delivered[poi_order], qty * received_draws[:line], 0).astype(np.int64)
+        total_amount = np.bincount(poi_order, weights=qty * unit_costs, minlength=n_pos)
+        
+        # Ids are numbered over the POs that were kept
+        po_ids = np.cumsum(kept)
+        self.purchase_orders = _downcast_integers(pd.DataFrame({
+            "po_id": po_ids[kept],
+            "supplier_id": supplier_ids[kept],
+            "warehouse_id": warehouse_ids[kept],
+            "order_date": self._to_dates(order_days[kept]),
+            "expected_delivery_date": self._to_dates(expected_delivery[kept]),
+            "actual_delivery_date": self._to_dates(np.where(delivered, actual_delivery, np.nan)[kept]),
+            "status": status[kept],
+            "total_amount": np.round(total_amount[kept], 2)
+        }))
+        self.purchase_orders.insert(1, "po_number", self._order_numbers("PO", self.purchase_orders, "po_id"))
+        self.purchase_order_items = _downcast_integers(pd.DataFrame({
+            "po_item_id": np.arange(1, line + 1),
+            "po_id": po_ids[poi_order],
+            "product_id": product_ids,
+            "quantity_ordered": qty,
+            "quantity_received": qty_received,
+            "unit_cost": unit_costs
+        }))
         print(f"  Generated {len(self.purchase_orders)} purchase orders with {len(self.purchase_order_items)} line items")
     
     def _generate_sales_orders(self):
         """Generate sales order history with seasonal patterns"""
-        so_list = []
-        soi_list = []
-        so_id = 1
-        soi_id = 1
-        
-        current_date = self.date_start
-        
-        while current_date <= self.date_end:
-            # Seasonal demand multiplier
-            month = current_date.month
-            if month in [11, 12]:  # Holiday season
-                seasonal_mult = 1.8
-            elif month in [1, 2]:  # Post-holiday slump
-                seasonal_mult = 0.7
-            elif month in [6, 7, 8]:  # Summer
-                seasonal_mult = 1.2
-            else:
-                seasonal_mult = 1.0
-            
-            # Day of week effect (lower on weekends)
-            dow = current_date.weekday()
-            if dow >= 5:  # Weekend
-                dow_mult = 0.4
-            else:
-                dow_mult = 1.0
-            
-            # Base orders per day
-            base_orders = 50
-            n_orders = int(base_orders * seasonal_mult * dow_mult * random.uniform(0.8, 1.2))
-            
-            for _ in range(n_orders):
-                customer = self.customers.sample(1).iloc[0]
-                warehouse = self.warehouses.sample(1).iloc[0]
-                
-                # Customer type affects order size
-                if customer.customer_type in ["Wholesale", "Distributor"]:
-                    n_items = random.randint(5, 15)
-                    qty_mult = random.randint(5, 20)
-                else:
-                    n_items = random.randint(1, 5)
-                    qty_mult = random.randint(1, 3)
-                
-                # Select products (biased toward A-class items)
-                products_sample = self.products.sample(n_items, weights='base_daily_demand')
-                
-                total_amount = 0
-                so_items = []
-                
-                for _, product in products_sample.iterrows():
-                    qty = random.randint(1, 10) * qty_mult
-                    discount = random.choice([0, 0, 0, 5, 10, 15]) if customer.customer_type != "Direct" else 0
-                    line_total = qty * product.unit_price * (1 - discount/100)
-                    total_amount += line_total
-                    
-                    # Determine shipped quantity
-                    order_age = (self.date_end - current_date).days
-                    if order_age > 7:
-                        status = "Delivered"
-                        qty_shipped = qty
-                    elif order_age > 3:
-                        status = "Shipped"
-                        qty_shipped = qty
-                    else:
-                        status = random.choice(["Pending", "Confirmed", "Picking"])
-                        qty_shipped = 0
-                    
-                    so_items.append({
-                        "so_item_id": soi_id,
-                        "so_id": so_id,
-                        "product_id": product.product_id,
-                        "quantity_ordered": qty,
-                        "quantity_shipped": qty_shipped,
-                        "unit_price": product.unit_price,
-                        "discount_percent": discount
-                    })
-                    soi_id += 1
-                
-                requested_delivery = current_date + timedelta(days=random.randint(3, 14))
-                actual_ship = current_date + timedelta(days=random.randint(1, 5)) if status in ["Shipped", "Delivered"] else None
-                
-                so_list.append({
-                    "so_id": so_id,
-                    "so_number": f"SO-{current_date.year}-{so_id:06d}",
-                    "customer_id": customer.customer_id,
-                    "warehouse_id": warehouse.warehouse_id,
-                    "order_date": current_date,
-                    "requested_delivery_date": requested_delivery,
-                    "actual_ship_date": actual_ship,
-                    "status": status,
-                    "total_amount": round(total_amount, 2),
-                    "shipping_cost": round(random.uniform(10, 100), 2)
-                })
-                
-                soi_list.extend(so_items)
-                so_id += 1
-            
-            current_date += timedelta(days=1)
-        
-        self.sales_orders = pd.DataFrame(so_list)
-        self.sales_order_items = pd.DataFrame(soi_list)
+        rng = self.rng
+        days = pd.date_range(self.date_start, self.date_end, freq="D")
+        day_noise = rng.uniform(0.8, 1.2, len(days))
+        
+        # Daily order counts follow the seasonal and day-of-week pattern
+        # Seasonal demand multiplier: holiday season, post-holiday slump, summer
+        month = days.month
+        seasonal_mult = np.select(
+            [month.isin([11, 12]), month.isin([1, 2]), month.isin([6, 7, 8])], [1.8, 0.7, 1.2], default=1.0
+        )
+        
+        # Day of week effect (lower on weekends)
+        dow_mult = np.where(days.dayofweek >= 5, 0.4, 1.0)
+        
+        # Base orders per day
+        base_orders = 50
+        orders_per_day = (base_orders * seasonal_mult * dow_mult * day_noise).astype(np.int64)
+        
+        # The schedule is then one flat sequence of orders with their random draws (and
+        # those of their lines). Dates are day numbers counted from date_start until the
+        # frame is built
+        order_days = np.repeat(np.arange(len(days)), orders_per_day)
+        n_orders = len(order_days)
+        customer_rows = rng.integers(0, len(self.customers), n_orders)
+        customer_ids = self.customers["customer_id"].to_numpy()[customer_rows]
+        customer_types = self.customers["customer_type"].to_numpy()[customer_rows]
+        warehouse_ids = self.warehouses["warehouse_id"].to_numpy()[rng.integers(0, len(self.warehouses), n_orders)]
+        
+        # Customer type affects order size
+        is_bulk = np.isin(customer_types, ["Wholesale", "Distributor"])
+        item_counts = np.where(is_bulk, rng.integers(5, 15, n_orders, endpoint=True),
+                               rng.integers(1, 5, n_orders, endpoint=True))
+        qty_mults = np.where(is_bulk, rng.integers(5, 20, n_orders, endpoint=True),
+                             rng.integers(1, 3, n_orders, endpoint=True))
+        
+        # Order status depends only on the order's age
+        order_age = (len(days) - 1) - order_days
+        is_shipped = order_age > 3
+        statuses = np.select(
+            [order_age > 7, is_shipped], ["Delivered", "Shipped"],
+            default=rng.choice(["Pending", "Confirmed", "Picking"], n_orders)
+        )
+        
+        delivery_offsets = rng.integers(3, 14, n_orders, endpoint=True)
+        ship_offsets = rng.integers(1, 5, n_orders, endpoint=True)
+        shipping_costs = np.round(rng.uniform(10, 100, n_orders), 2)
+        n_lines = item_counts.sum()
+        qty_draws = rng.integers(1, 10, n_lines, endpoint=True)
+        discount_draws = rng.choice([0, 0, 0, 5, 10, 15], n_lines)
+        
+        # Select each order's distinct products in proportion to their base demand
+        # (biased toward A-class items); the lines are computed per column from there
+        demand = self.products["base_daily_demand"].to_numpy()
+        product_probs = demand / demand.sum()
+        line_products = np.concatenate([
+            rng.choice(len(self.products), n_items, replace=False, p=product_probs)
+            for n_items in item_counts
+        ])
+        line_order = np.repeat(np.arange(n_orders), item_counts)
+        
+        qty = qty_draws * qty_mults[line_order]
+        discount = np.where(customer_types[line_order] != "Direct", discount_draws, 0)
+        unit_price = self._product_unit_price[line_products]
+        line_total = qty * unit_price * (1 - discount/100)
+        total_amount = np.bincount(line_order, weights=line_total, minlength=n_orders)
+        
+        so_ids = np.arange(1, n_orders + 1)
+        self.sales_orders = _downcast_integers(pd.DataFrame({
+            "so_id": so_ids,
+            "customer_id": customer_ids,
+            "warehouse_id": warehouse_ids,
+            "order_date": self._to_dates(order_days),
+            "requested_delivery_date": self._to_dates(order_days + delivery_offsets),
+            "actual_ship_date": self._to_dates(np.where(is_shipped, order_days + ship_offsets, np.nan)),
+            "status": statuses,
+            "total_amount": np.round(total_amount, 2),
+            "shipping_cost": shipping_costs
+        }))
+        self.sales_orders.insert(1, "so_number", self._order_numbers("SO", self.sales_orders, "so_id"))
+        self.sales_order_items = _downcast_integers(pd.DataFrame({
+            "so_item_id": np.arange(1, n_lines + 1),
+            "so_id": so_ids[line_order],
+            "product_id": self.products["product_id"].to_numpy()[line_products],
+            "quantity_ordered": qty,
+            # Determine shipped quantity
+            "quantity_shipped": np.where(is_shipped[line_order], qty, 0),
+            "unit_price": unit_price,
+            "discount_percent": discount
+        }))
         print(f"  Generated {len(self.sales_orders)} sales orders with {len(self.sales_order_items)} line items")
     
     def _generate_inventory(self):
         """Generate current inventory levels"""
-        inv_list = []
-        inv_id = 1
-        
-        for _, warehouse in self.warehouses.iterrows():
-            for _, product in self.products.iterrows():
-                # Calculate typical demand
-                avg_daily = product.base_daily_demand / self.n_warehouses
-                
-                # Reorder point based on lead time and safety stock
-                reorder_point = int(avg_daily * (product.lead_time_days + product.safety_stock_days))
-                reorder_qty = int(avg_daily * 30)  # ~1 month supply
-                
-                # Current quantity - some randomization
-                qty_on_hand = int(reorder_point * random.uniform(0.5, 3.0))
-                qty_reserved = int(qty_on_hand * random.uniform(0, 0.3))
-                
-                inv_list.append({
-                    "inventory_id": inv_id,
-                    "warehouse_id": warehouse.warehouse_id,
-                    "product_id": product.product_id,
-                    "quantity_on_hand": qty_on_hand,
-                    "quantity_reserved": qty_reserved,
-                    "reorder_point": reorder_point,
-                    "reorder_quantity": reorder_qty,
-                    "last_received_date": self.date_end - timedelta(days=random.randint(1, 30)),
-                    "last_sold_date": self.date_end - timedelta(days=random.randint(0, 14))
-                })
-                inv_id += 1
-        
-        self.inventory = pd.DataFrame(inv_list)
+        rng = self.rng
+        warehouse_ids = self.warehouses["warehouse_id"].to_numpy()
+        n_wh, n_prod = len(warehouse_ids), len(self.products)
+        n_rows = n_wh * n_prod
+        
+        # One row per (warehouse, product); product attributes tile across warehouses
+        def per_row(col):
+            return np.tile(self.products[col].to_numpy(), n_wh)
+        
+        # Calculate typical demand
+        avg_daily = per_row("base_daily_demand") / self.n_warehouses
+        
+        # Reorder point based on lead time and safety stock
+        reorder_point = (avg_daily * (per_row("lead_time_days") + per_row("safety_stock_days"))).astype(np.int64)
+        reorder_qty = (avg_daily * 30).astype(np.int64)  # ~1 month supply
+        
+        # Current quantity - some randomization
+        qty_on_hand = (reorder_point * rng.uniform(0.5, 3.0, n_rows)).astype(np.int64)
+        qty_reserved = (qty_on_hand * rng.uniform(0, 0.3, n_rows)).astype(np.int64)
+        
+        date_end = np.datetime64(self.date_end, "D")
+        self.inventory = _downcast_integers(pd.DataFrame({
+            "inventory_id": np.arange(1, n_rows + 1),
+            "warehouse_id": np.repeat(warehouse_ids, n_prod),
+            "product_id": per_row("product_id"),
+            "quantity_on_hand": qty_on_hand,
+            "quantity_reserved": qty_reserved,
+            "reorder_point": reorder_point,
+            "reorder_quantity": reorder_qty,
+            "last_received_date": date_end - rng.integers(1, 30, n_rows, endpoint=True),
+            "last_sold_date": date_end - rng.integers(0, 14, n_rows, endpoint=True)
+        }))
         print(f"  Generated {len(self.inventory)} inventory records")
     
     def _generate_inventory_transactions(self):
         """Generate inventory movement history"""
-        trans_list = []
-        trans_id = 1
+        # Receipts: received lines of delivered POs
+        delivered = self.purchase_orders.loc[
+            self.purchase_orders.status == "Delivered", ["po_id", "warehouse_id", "actual_delivery_date"]
+        ]
+        receipts = self.purchase_order_items.merge(delivered, on="po_id")
+        receipts = receipts[receipts.quantity_received > 0]
         
-        # Generate from delivered POs
-        for _, po in self.purchase_orders[self.purchase_orders.status == "Delivered"].iterrows():
-            po_items = self.purchase_order_items[self.purchase_order_items.po_id == po.po_id]
-            
-            for _, item in po_items.iterrows():
-                if item.quantity_received > 0:
-                    product = self.products[self.products.product_id == item.product_id].iloc[0]
-                    trans_list.append({
-                        "transaction_id": trans_id,
-                        "warehouse_id": po.warehouse_id,
-                        "product_id": item.product_id,
-                        "transaction_type": "Receipt",
-                        "quantity": item.quantity_received,
-                        "reference_type": "PO",
-                        "reference_id": po.po_id,
-                        "unit_cost": item.unit_cost,
-                        "transaction_date": po.actual_delivery_date
-                    })
-                    trans_id += 1
-        
-        # Generate from shipped SOs
-        for _, so in self.sales_orders[self.sales_orders.status.isin(["Shipped", "Delivered"])].iterrows():
-            so_items = self.sales_order_items[self.sales_order_items.so_id == so.so_id]
-            
-            for _, item in so_items.iterrows():
-                if item.quantity_shipped > 0:
-                    product = self.products[self.products.product_id == item.product_id].iloc[0]
-                    trans_list.append({
-                        "transaction_id": trans_id,
-                        "warehouse_id": so.warehouse_id,
-                        "product_id": item.product_id,
-                        "transaction_type": "Sale",
-                        "quantity": -item.quantity_shipped,
-                        "reference_type": "SO",
-                        "reference_id": so.so_id,
-                        "unit_cost": product.unit_cost,
-                        "transaction_date": so.actual_ship_date
-                    })
-                    trans_id += 1
-        
-        self.inventory_transactions = pd.DataFrame(trans_list)
+        # Sales: shipped lines of shipped SOs, valued at product cost
+        shipped = self.sales_orders.loc[
+            self.sales_orders.status.isin(["Shipped", "Delivered"]), ["so_id", "warehouse_id", "actual_ship_date"]
+        ]
+        sales = self.sales_order_items.merge(shipped, on="so_id")
+        sales = sales[sales.quantity_shipped > 0]
+        
+        counts = [len(receipts), len(sales)]
+        self.inventory_transactions = _downcast_integers(pd.DataFrame({
+            "transaction_id": np.arange(1, sum(counts) + 1),
+            "warehouse_id": np.concatenate([receipts.warehouse_id.to_numpy(), sales.warehouse_id.to_numpy()]),
+            "product_id": np.concatenate([receipts.product_id.to_numpy(), sales.product_id.to_numpy()]),
+            "transaction_type": np.repeat(["Receipt", "Sale"], counts),
+            "quantity": np.concatenate([receipts.quantity_received.to_numpy(), -sales.quantity_shipped.to_numpy()]),
+            "reference_type": np.repeat(["PO", "SO"], counts),
+            "reference_id": np.concatenate([receipts.po_id.to_numpy(), sales.so_id.to_numpy()]),
+            "unit_cost": np.concatenate([
+                receipts.unit_cost.to_numpy(), self._product_unit_cost[sales.product_id.to_numpy() - 1]
+            ]),
+            "transaction_date": np.concatenate([
+                receipts.actual_delivery_date.to_numpy(), sales.actual_ship_date.to_numpy()
+            ])
+        }))
         print(f"  Generated {len(self.inventory_transactions)} inventory transactions")
     
-    def _generate_demand_forecasts(self):
+    def _generate_demand_forecasts(self, rng: np.random.Generator = None):
         """Generate demand forecast data"""
-        forecast_list = []
-        forecast_id = 1
+        rng = rng if rng is not None else self.rng
         
         # Generate daily forecasts for next 30 days
         forecast_start = self.date_end - timedelta(days=90)
         forecast_end = self.date_end + timedelta(days=30)
-        
-        for _, warehouse in self.warehouses.iterrows():
-            for _, product in self.products.iterrows():
-                avg_demand = product.base_daily_demand / self.n_warehouses
-                current_date = forecast_start
-                
-                while current_date <= forecast_end:
-                    # Add some seasonality and trend
-                    month_factor = 1.0 + 0.3 * np.sin(2 * np.pi * current_date.month / 12)
-                    trend = 1.0 + (current_date - forecast_start).days * 0.001
-                    
-                    base_forecast = avg_demand * month_factor * trend
-                    forecast_qty = max(0, int(base_forecast + np.random.normal(0, base_forecast * 0.2)))
-                    
-                    # Confidence interval
-                    conf_width = int(forecast_qty * 0.3)
-                    
-                    forecast_list.append({
-                        "forecast_id": forecast_id,
-                        "product_id": product.product_id,
-                        "warehouse_id": warehouse.warehouse_id,
-                        "forecast_date": current_date,
-                        "forecast_period": "Daily",
-                        "forecasted_quantity": forecast_qty,
-                        "confidence_lower": max(0, forecast_qty - conf_width),
-                        "confidence_upper": forecast_qty + conf_width,
-                        "model_used": random.choice(["ARIMA", "Prophet", "LightGBM", "Exponential_Smoothing"])
-                    })
-                    forecast_id += 1
-                    current_date += timedelta(days=1)
-        
-        self.demand_forecasts = pd.DataFrame(forecast_list)
+        dates = pd.date_range(forecast_start, forecast_end, freq="D")
+        
+        warehouse_ids = self.warehouses["warehouse_id"].to_numpy()
+        product_ids = self.products["product_id"].to_numpy()
+        n_wh, n_prod, n_days = len(warehouse_ids), len(product_ids), len(dates)
+        
+        # Add some seasonality and trend (per day), scaled by each product's average demand;
+        # axes are (warehouse, product, day), matching the row order of the output
+        month_factor = 1.0 + 0.3 * np.sin(2 * np.pi * dates.month.to_numpy() / 12)
+        trend = 1.0 + np.arange(n_days) * 0.001
+        avg_demand = self.products["base_daily_demand"].to_numpy() / self.n_warehouses
+        base_forecast = np.broadcast_to(
+            avg_demand[None, :, None] * (month_factor * trend)[None, None, :],
+            (n_wh, n_prod, n_days)
+        )
+        forecast_qty = np.maximum(
+            0, base_forecast + rng.normal(0, base_forecast * 0.2)
+        ).astype(np.int64).ravel()
+        
+        # Confidence interval
+        conf_width = (forecast_qty * 0.3).astype(np.int64)
+        
+        n_rows = forecast_qty.size
+        self.demand_forecasts = _downcast_integers(pd.DataFrame({
+            "forecast_id": np.arange(1, n_rows + 1),
+            "product_id": np.tile(np.repeat(product_ids, n_days), n_wh),
+            "warehouse_id": np.repeat(warehouse_ids, n_prod * n_days),
+            "forecast_date": np.tile(dates.to_numpy(), n_wh * n_prod),
+            "forecast_period": "Daily",
+            "forecasted_quantity": forecast_qty,
+            "confidence_lower": np.maximum(0, forecast_qty - conf_width),
+            "confidence_upper": forecast_qty + conf_width,
+            "model_used": rng.choice(["ARIMA", "Prophet", "LightGBM", "Exponential_Smoothing"], n_rows)
+        }))
         print(f"  Generated {len(self.demand_forecasts)} demand forecasts")
     
     def _generate_stockout_events(self):
         """Generate stockout event history"""
-        stockout_list = []
-        stockout_id = 1
+        rng = self.rng
+        root_causes = [
+            "Supplier delay", "Demand spike", "Forecast error", 
+            "Quality issue", "Transportation delay", "System error"
+        ]
         
-        # Identify low-inventory items and create stockout events
-        for _, inv in self.inventory.iterrows():
-            product = self.products[self.products.product_id == inv.product_id].iloc[0]
-            
-            # Products with low stock relative to demand may have had stockouts
-            if inv.quantity_on_hand < inv.reorder_point * 0.5:
-                # Generate 1-3 stockout events for this product
-                n_events = random.randint(1, 3)
-                
-                for _ in range(n_events):
-                    start_date = self.date_start + timedelta(days=random.randint(30, 300))
-                    duration = random.randint(1, 7)
-                    end_date = start_date + timedelta(days=duration)
-                    
-                    daily_demand = product.base_daily_demand / self.n_warehouses
-                    lost_demand = int(daily_demand * duration * random.uniform(0.5, 1.5))
-                    lost_sales = round(lost_demand * product.unit_price, 2)
-                    
-                    root_causes = [
-                        "Supplier delay", "Demand spike", "Forecast error", 
-                        "Quality issue", "Transportation delay", "System error"
-                    ]
-                    
-                    stockout_list.append({
-                        "stockout_id": stockout_id,
-                        "warehouse_id": inv.warehouse_id,
-                        "product_id": inv.product_id,
-                        "stockout_start_date": start_date,
-                        "stockout_end_date": end_date,
-                        "demand_during_stockout": lost_demand,
-                        "lost_sales_amount": lost_sales,
-                        "root_cause": random.choice(root_causes)
-                    })
-                    stockout_id += 1
-        
-        self.stockout_events = pd.DataFrame(stockout_list)
+        # Products with low stock relative to demand may have had stockouts
+        low_stock = self.inventory[self.inventory.quantity_on_hand < self.inventory.reorder_point * 0.5]
+        
+        # Generate 1-3 stockout events for each low-stock item, one row per event
+        n_events = rng.integers(1, 3, len(low_stock), endpoint=True)
+        events = low_stock.iloc[np.repeat(np.arange(len(low_stock)), n_events)]
+        n_rows = len(events)
+        product_idx = events.product_id.to_numpy().astype(np.int64) - 1
+        
+        start_day = rng.integers(30, 300, n_rows, endpoint=True)
+        duration = rng.integers(1, 7, n_rows, endpoint=True)
+        
+        daily_demand = self._product_base_demand[product_idx] / self.n_warehouses
+        lost_demand = (daily_demand * duration * rng.uniform(0.5, 1.5, n_rows)).astype(np.int64)
+        lost_sales = np.round(lost_demand * self._product_unit_price[product_idx], 2)
+        
+        self.stockout_events = _downcast_integers(pd.DataFrame({
+            "stockout_id": np.arange(1, n_rows + 1),
+            "warehouse_id": events.warehouse_id.to_numpy(),
+            "product_id": events.product_id.to_numpy(),
+            "stockout_start_date": self._to_dates(start_day),
+            "stockout_end_date": self._to_dates(start_day + duration),
+            "demand_during_stockout": lost_demand,
+            "lost_sales_amount": lost_sales,
+            "root_cause": rng.choice(root_causes, n_rows)
+        }))
         print(f"  Generated {len(self.stockout_events)} stockout events")
     
-    def _save_all(self):
-        """Save all generated data to CSV files"""
+    def _phone_numbers(self, n: int) -> np.ndarray:
+        """Draw n random 555 phone numbers"""
+        exchanges = self.rng.integers(100, 999, n, endpoint=True).astype(str)
+        lines = self.rng.integers(1000, 9999, n, endpoint=True).astype(str)
+        return np.char.add(np.char.add("555-", exchanges), np.char.add("-", lines))
+    
+    def _to_dates(self, day_numbers) -> pd.DatetimeIndex:
+        """Convert day numbers counted from date_start (None for no date) to dates"""
+        return pd.to_datetime(np.array(day_numbers, dtype=float), unit="D", origin=self.date_start)
+    
+    @staticmethod
+    def _order_numbers(prefix: str, orders: pd.DataFrame, id_col: str) -> np.ndarray:
+        """Build order numbers such as PO-2024-000042 from order year and id"""
+        years = orders["order_date"].dt.year.to_numpy().astype(str)
+        return _format_codes(np.char.add(np.char.add(f"{prefix}-", years), "-"), orders[id_col], 6)
+    
+    def _save_all(self, formats: tuple = ("csv", "parquet")):
+        """
+        Save all generated data to CSV and/or Parquet files.
+        
+        CSV is what the SQL and Tableau loaders read; the Parquet copy is written
+        after it, so the analytics engine picks it up as an up-to-date cache
+        instead of re-parsing the CSV.
+        """
         datasets = {
             "warehouses": self.warehouses,
             "product_categories": self.categories,
@@ -675,10 +713,62 @@ class SupplyChainDataGenerator:
             "stockout_events": self.stockout_events
         }
         
-        for name, df in datasets.items():
-            filepath = os.path.join(self.output_dir, f"{name}.csv")
-            df.to_csv(filepath, index=False)
-            print(f"  Saved {filepath}")
+        def save(name: str, df: pd.DataFrame) -> list:
+            saved = []
+            if "csv" in formats:
+                filepath = os.path.join(self.output_dir, f"{name}.csv")
+                # One large buffer per file, so the formatted chunks reach the OS in few writes
+                with open(filepath, "w", buffering=CSV_WRITE_BUFFER, encoding="utf-8", newline="") as f:
+                    df.to_csv(f, index=False, date_format="%Y-%m-%d")
+                saved.append(filepath)
+            if "parquet" in formats:
+                filepath = os.path.join(self.output_dir, f"{name}.parquet")
+                self._write_parquet(df, filepath)
+                saved.append(filepath)
+            return saved
+        
+        # Tables are written concurrently so their disk I/O overlaps; each table still
+        # writes its CSV before its Parquet copy, and the log is printed in one go
+        with ThreadPoolExecutor(max_workers=min(8, len(datasets))) as pool:
+            saved = pool.map(save, datasets.keys(), datasets.values())
+            print("\n".join(f"  Saved {filepath}" for paths in saved for filepath in paths))
+    
+    @staticmethod
+    def _write_parquet(df: pd.DataFrame, filepath: str, chunk_rows: int = 131_072):
+        """
+        Write a table to Parquet one row group at a time.
+        
+        Only one chunk of rows is converted to Arrow at once, so writing the large
+        fact tables does not hold a second full copy of them in memory. The row
+        groups go to a temporary file that only replaces `filepath` once complete,
+        so a failed write never leaves a truncated table behind.
+        """
+        # Integer columns (ids are sequential, quantities narrow) pack best as deltas;
+        # everything else keeps dictionary encoding
+        int_cols = set(df.select_dtypes("integer").columns)
+        tmp_path = f"{filepath}.tmp"
+        writer = None
+        try:
+            for start in range(0, max(len(df), 1), chunk_rows):
+                chunk = pa.Table.from_pandas(
+                    df.iloc[start:start + chunk_rows], preserve_index=False,
+                    schema=writer.schema if writer else None
+                )
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        tmp_path, chunk.schema, compression="zstd",
+                        use_dictionary=[col for col in df.columns if col not in int_cols],
+                        column_encoding=dict.fromkeys(int_cols, "DELTA_BINARY_PACKED")
+                    )
+                writer.write_table(chunk, row_group_size=chunk_rows)
+            writer.close()
+            writer = None
+            os.replace(tmp_path, filepath)
+        finally:
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
     
     def get_summary(self) -> dict:
         """Return summary statistics of generated data"""